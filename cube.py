@@ -6,16 +6,18 @@ This module provides a 3×3×3 Rubik's cube data structure and methods for
 applying standard cube rotations.  The implementation is adapted from
 the open‑source project `pglass/cube` under the MIT licence.
 
-The cube is represented by ``Piece`` objects positioned in a 3D coordinate
-system.  Faces, edges, and corners are assigned coordinates on the axes:
+Pieces are positioned in a 3D coordinate system.  Faces, edges, and
+corners are assigned coordinates on the axes:
 
 * +x is the right direction, –x is left
 * +y is up, –y is down
 * +z is front, –z is back
 
-Each ``Piece`` stores the colours of its stickers along the axes.  The
-``Cube`` class groups together the pieces and exposes methods
-corresponding to Rubik's cube moves (e.g. ``R``, ``U``, ``F`` etc.).
+The ``Cube`` class stores the 54 stickers as a facelet permutation and
+exposes methods corresponding to Rubik's cube moves (e.g. ``R``, ``U``,
+``F`` etc.).  The permutation for every move is derived once, at import
+time, from the geometry above.  ``Piece`` objects are views that track a
+single cubie through those permutations.
 
 Example
 -------
@@ -26,6 +28,9 @@ Example
 
 """
 
+import functools
+import math
+import operator
 import string
 from rubik.maths import Point, Matrix
 
@@ -67,6 +72,16 @@ ROT_YZ_CC = Matrix(1, 0, 0,
                    0, 1, 0)
 
 
+_FACE_TO_MOVES = {
+    RIGHT: ("R", "Ri"),
+    LEFT:  ("L", "Li"),
+    UP:    ("U", "Ui"),
+    DOWN:  ("D", "Di"),
+    FRONT: ("F", "Fi"),
+    BACK:  ("B", "Bi"),
+}
+
+
 def get_rot_from_face(face):
     """Return the clockwise and counter‑clockwise move names for the given face.
 
@@ -79,74 +94,338 @@ def get_rot_from_face(face):
     -------
     tuple of str
         A pair ``(CW, CC)`` representing the rotation names used by
-        ``Cube.sequence()``.
+        ``Cube.sequence()``, or ``None`` for any other point.
+    """
+    return _FACE_TO_MOVES.get(face)
+
+
+# Layout of the 26 pieces in the 54‑character net string: each entry gives
+# the piece position and the string index of the sticker on its x, y and z
+# face (``None`` if the piece has no sticker on that axis).  The order is
+# faces, then edges, then corners.
+_PIECE_LAYOUT = (
+    # faces
+    (RIGHT, (28, None, None)),
+    (LEFT,  (22, None, None)),
+    (UP,    (None, 4,  None)),
+    (DOWN,  (None, 49, None)),
+    (FRONT, (None, None, 25)),
+    (BACK,  (None, None, 31)),
+    # edges
+    (RIGHT + UP,    (16, 5, None)),
+    (RIGHT + DOWN,  (40, 50, None)),
+    (RIGHT + FRONT, (27, None, 26)),
+    (RIGHT + BACK,  (29, None, 30)),
+    (LEFT + UP,     (10, 3, None)),
+    (LEFT + DOWN,   (34, 48, None)),
+    (LEFT + FRONT,  (23, None, 24)),
+    (LEFT + BACK,   (21, None, 32)),
+    (UP + FRONT,    (None, 7,  13)),
+    (UP + BACK,     (None, 1,  19)),
+    (DOWN + FRONT,  (None, 46, 37)),
+    (DOWN + BACK,   (None, 52, 43)),
+    # corners
+    (RIGHT + UP + FRONT,   (15, 8, 14)),
+    (RIGHT + UP + BACK,    (17, 2, 18)),
+    (RIGHT + DOWN + FRONT, (39, 47, 38)),
+    (RIGHT + DOWN + BACK,  (41, 53, 42)),
+    (LEFT + UP + FRONT,    (11, 6, 12)),
+    (LEFT + UP + BACK,     (9,  0, 20)),
+    (LEFT + DOWN + FRONT,  (35, 45, 36)),
+    (LEFT + DOWN + BACK,   (33, 51, 44)),
+)
+
+# Per facelet (net string index): the position of its piece and the axis
+# the sticker faces along.
+_FACELET_POS = [None] * 54
+_FACELET_AXIS = [None] * 54
+# Per piece: the facelet indices of its stickers in the solved layout.
+_PIECE_FACELETS = []
+for _pos, _facelets in _PIECE_LAYOUT:
+    for _axis, _facelet in enumerate(_facelets):
+        if _facelet is not None:
+            _FACELET_POS[_facelet] = _pos
+            _FACELET_AXIS[_facelet] = _axis
+    _PIECE_FACELETS.append(tuple(f for f in _facelets if f is not None))
+_FACELET_POS = tuple(_FACELET_POS)
+_FACELET_AXIS = tuple(_FACELET_AXIS)
+_PIECE_FACELETS = tuple(_PIECE_FACELETS)
+# The layout is the same for every cube, so check it once here rather than
+# in each Cube constructor: 6 faces, 12 edges, 8 corners covering 54 stickers
+assert [len(f) for f in _PIECE_FACELETS] == [1] * 6 + [2] * 12 + [3] * 8
+assert sorted(f for fs in _PIECE_FACELETS for f in fs) == list(range(54))
+# Piece index owning each sticker, and one facelet at each piece position
+_PIECE_OF_FACELET = tuple(next(i for i, fs in enumerate(_PIECE_FACELETS) if f in fs)
+                          for f in range(54))
+_FACELET_AT = {tuple(pos): facelets[0]
+               for (pos, _), facelets in zip(_PIECE_LAYOUT, _PIECE_FACELETS)}
+# Facelet holding the sticker at a position that faces along an axis
+_FACELET_INDEX = {(tuple(pos), axis): facelet for facelet, (pos, axis)
+                  in enumerate(zip(_FACELET_POS, _FACELET_AXIS))}
+
+# Facelets making up each face of the net
+_FACE_FACELETS = (
+    tuple(range(0, 9)),                     # up
+    (9, 10, 11, 21, 22, 23, 33, 34, 35),    # left
+    (12, 13, 14, 24, 25, 26, 36, 37, 38),   # front
+    (15, 16, 17, 27, 28, 29, 39, 40, 41),   # right
+    (18, 19, 20, 30, 31, 32, 42, 43, 44),   # back
+    tuple(range(45, 54)),                   # down
+)
+# Gathers the centre sticker of its face for every facelet; a cube is solved
+# exactly when this leaves its colours unchanged
+_FACE_CENTRES = operator.itemgetter(*(next(face[4] for face in _FACE_FACELETS if f in face)
+                                      for f in range(54)))
+
+# Net diagram filled in by ``Cube.__str__``, one facelet per placeholder
+_NET_TEMPLATE = ("    {}{}{}\n"
+                 "    {}{}{}\n"
+                 "    {}{}{}\n"
+                 "{}{}{} {}{}{} {}{}{} {}{}{}\n"
+                 "{}{}{} {}{}{} {}{}{} {}{}{}\n"
+                 "{}{}{} {}{}{} {}{}{} {}{}{}\n"
+                 "    {}{}{}\n"
+                 "    {}{}{}\n"
+                 "    {}{}{}")
+
+
+# Sizes of the corner orientation, edge orientation and UD-slice
+# coordinates used by two-phase (Kociemba) solvers
+N_TWIST = 3 ** 7
+N_FLIP = 2 ** 11
+N_SLICE = 495
+
+
+def _coordinate_facelets():
+    """Return the facelets read by ``Cube.coord_index``.
+
+    Corners are listed in the order URF, UFL, ULB, UBR, DFR, DLF, DBL, DRB
+    with their stickers running clockwise from the U/D sticker.  Edges are
+    listed as UR, UF, UL, UB, DR, DF, DL, DB, FR, FL, BL, BR with the U/D
+    sticker first, or the F/B sticker for the four middle slice edges.
+    """
+    by_pos = {tuple(pos): facelets for pos, facelets in _PIECE_LAYOUT}
+    corners = []
+    for pos in ((1, 1, 1), (-1, 1, 1), (-1, 1, -1), (1, 1, -1),
+                (1, -1, 1), (-1, -1, 1), (-1, -1, -1), (1, -1, -1)):
+        x, y, z = by_pos[pos]
+        corners.append((y, x, z) if pos[0] * pos[1] * pos[2] > 0 else (y, z, x))
+    edges = []
+    for pos in ((1, 1, 0), (0, 1, 1), (-1, 1, 0), (0, 1, -1),
+                (1, -1, 0), (0, -1, 1), (-1, -1, 0), (0, -1, -1),
+                (1, 0, 1), (-1, 0, 1), (-1, 0, -1), (1, 0, -1)):
+        x, y, z = by_pos[pos]
+        edges.append((y, x if z is None else z) if y is not None else (z, x))
+    return tuple(corners), tuple(edges)
+
+
+_CORNER_FACELETS, _EDGE_FACELETS = _coordinate_facelets()
+
+
+def _move_perm(selected, matrix):
+    """Build the facelet permutation for rotating part of the cube.
+
+    Each sticker is identified by its piece position and the direction it
+    faces.  Rotating both with ``matrix`` gives the facelet it lands on.
+    The result ``perm`` is a gather: after the move, facelet ``i`` holds
+    whatever facelet ``perm[i]`` held before.
+    """
+    index = {}
+    for facelet, (pos, axis) in enumerate(zip(_FACELET_POS, _FACELET_AXIS)):
+        normal = [0, 0, 0]
+        normal[axis] = pos[axis]
+        index[tuple(pos), tuple(normal)] = facelet
+    perm = list(range(54))
+    for (pos, normal), facelet in index.items():
+        pos = Point(pos)
+        if selected(pos):
+            perm[index[tuple(matrix * pos), tuple(matrix * Point(normal))]] = facelet
+    return tuple(perm)
+
+
+def _on_face(face):
+    """Return a predicate selecting positions on ``face``.
+
+    ``face`` is a unit vector, so the dot product reduces to checking one
+    coordinate against the sign of the face.
+    """
+    assert face.count(0) == 2
+    i = next(i for i, x in enumerate(face) if x != 0)
+    sign = face[i]
+    return lambda pos: pos[i] == sign
+
+
+def _in_slice(plane):
+    """Return a predicate selecting positions in the slice through ``plane``."""
+    assert plane.count(0) == 1
+    i = next(i for i, x in enumerate(plane) if x == 0)
+    return lambda pos: pos[i] == 0
+
+
+def _whole_cube(pos):
+    return True
+
+
+# Standard Rubik's Cube Notation: http://ruwix.com/the-rubiks-cube/notation/
+PERMS = {
+    'L':  _move_perm(_on_face(LEFT), ROT_YZ_CC),
+    'Li': _move_perm(_on_face(LEFT), ROT_YZ_CW),
+    'R':  _move_perm(_on_face(RIGHT), ROT_YZ_CW),
+    'Ri': _move_perm(_on_face(RIGHT), ROT_YZ_CC),
+    'U':  _move_perm(_on_face(UP), ROT_XZ_CW),
+    'Ui': _move_perm(_on_face(UP), ROT_XZ_CC),
+    'D':  _move_perm(_on_face(DOWN), ROT_XZ_CC),
+    'Di': _move_perm(_on_face(DOWN), ROT_XZ_CW),
+    'F':  _move_perm(_on_face(FRONT), ROT_XY_CW),
+    'Fi': _move_perm(_on_face(FRONT), ROT_XY_CC),
+    'B':  _move_perm(_on_face(BACK), ROT_XY_CC),
+    'Bi': _move_perm(_on_face(BACK), ROT_XY_CW),
+    'M':  _move_perm(_in_slice(Y_AXIS + Z_AXIS), ROT_YZ_CC),
+    'Mi': _move_perm(_in_slice(Y_AXIS + Z_AXIS), ROT_YZ_CW),
+    'E':  _move_perm(_in_slice(X_AXIS + Z_AXIS), ROT_XZ_CC),
+    'Ei': _move_perm(_in_slice(X_AXIS + Z_AXIS), ROT_XZ_CW),
+    'S':  _move_perm(_in_slice(X_AXIS + Y_AXIS), ROT_XY_CW),
+    'Si': _move_perm(_in_slice(X_AXIS + Y_AXIS), ROT_XY_CC),
+    'X':  _move_perm(_whole_cube, ROT_YZ_CW),
+    'Xi': _move_perm(_whole_cube, ROT_YZ_CC),
+    'Y':  _move_perm(_whole_cube, ROT_XZ_CW),
+    'Yi': _move_perm(_whole_cube, ROT_XZ_CC),
+    'Z':  _move_perm(_whole_cube, ROT_XY_CW),
+    'Zi': _move_perm(_whole_cube, ROT_XY_CC),
+}
+_GATHERS = {name: operator.itemgetter(*perm) for name, perm in PERMS.items()}
+
+
+def _move_method(name):
+    """Return a ``Cube`` method applying the named move.
+
+    The move's gather is bound into the closure, so calling the method is
+    a single gather with no name lookup or dispatch through a helper.
+    """
+    gather = _GATHERS[name]
+    def move(self):
+        self.state = gather(self.state)
+    move.__name__ = move.__qualname__ = name
+    move.__doc__ = f"Apply the ``{name}`` move."
+    return move
+
+
+@functools.lru_cache(maxsize=4096)
+def compose(moves):
+    """Return the facelet permutation for a tuple of move names applied in order.
+
+    Results are cached, so algorithms the solver repeats cost a single
+    gather after their first use.  An unknown move name raises the same
+    ``AttributeError`` that looking the move up on a ``Cube`` would, before
+    any move is applied.
     """
-    if face == RIGHT:
-        return "R", "Ri"
-    elif face == LEFT:
-        return "L", "Li"
-    elif face == UP:
-        return "U", "Ui"
-    elif face == DOWN:
-        return "D", "Di"
-    elif face == FRONT:
-        return "F", "Fi"
-    elif face == BACK:
-        return "B", "Bi"
-    return None
+    perm = tuple(range(54))
+    for name in moves:
+        gather = _GATHERS.get(name)
+        if gather is None:
+            raise AttributeError(f"'Cube' object has no attribute {name!r}")
+        perm = gather(perm)
+    return perm
+
+
+@functools.lru_cache(maxsize=4096)
+def _composed_gather(moves):
+    return operator.itemgetter(*compose(moves))
+
+
+@functools.lru_cache(maxsize=256)
+def _sticker_gather(stickers):
+    # Gathers the given (position, axis) stickers out of the packed colours
+    facelets = tuple(_FACELET_INDEX[(tuple(pos), axis)] for pos, axis in stickers)
+    if len(facelets) == 1:
+        return lambda colors: (colors[facelets[0]],)
+    return operator.itemgetter(*facelets)
+
+
+@functools.lru_cache(maxsize=4096)
+def _sequence_gather(move_str):
+    # Keyed on the raw string so repeated algorithms skip splitting as well
+    return _composed_gather(tuple(move_str.split()))
+
+
+def _build_cubie_axes():
+    """Return, per piece, a table from the facelet holding its first sticker
+    to the sticker facing along each axis (``None`` where there is none).
+
+    Moves carry a cubie around rigidly, so where its first sticker sits fixes
+    both its slot and its orientation, and with them every other sticker.
+    The tables are filled by following each piece through all moves.
+    """
+    inverses = []
+    for perm in PERMS.values():
+        inverse = [0] * 54
+        for i, f in enumerate(perm):
+            inverse[f] = i
+        inverses.append(inverse)
+    tables = []
+    for facelets in _PIECE_FACELETS:
+        table = {}
+        frontier = [facelets]
+        while frontier:
+            spots = frontier.pop()
+            if spots[0] in table:
+                continue
+            axes = [None, None, None]
+            for sticker, spot in zip(facelets, spots):
+                axes[_FACELET_AXIS[spot]] = sticker
+            table[spots[0]] = tuple(axes)
+            frontier.extend(tuple(inverse[f] for f in spots) for inverse in inverses)
+        tables.append(table)
+    return tuple(tables)
+
+
+_CUBIE_AXES = _build_cubie_axes()
 
 
 class Piece:
-    """Represents a single cubie on the Rubik's cube."""
-
-    def __init__(self, pos, colors):
-        """Construct a piece at the given position with the given colours.
-
-        Parameters
-        ----------
-        pos : Point
-            A 3D coordinate with components in {-1, 0, 1}.
-        colors : tuple of length 3
-            Gives the colour on the x, y and z faces (``None`` if the
-            sticker is missing on that axis).
-        """
-        assert all(isinstance(x, int) and x in (-1, 0, 1) for x in pos)
-        assert len(colors) == 3
-        self.pos = pos
-        self.colors = list(colors)
+    """A view onto a single cubie of a ``Cube``.
+
+    A piece is identified by the stickers it carries, so it follows the
+    cubie around as moves are applied and always reflects the current
+    state of the cube it belongs to.  Colours are not stored on the piece;
+    they are read from the cube's sticker labels on access.
+    """
+
+    __slots__ = ('_cube', '_facelets', '_axes', 'type')
+
+    def __init__(self, cube, index):
+        self._cube = cube
+        self._facelets = _PIECE_FACELETS[index]
+        self._axes = _CUBIE_AXES[index]
         self._set_piece_type()
 
+    @property
+    def pos(self):
+        return _FACELET_POS[self._cube.state.index(self._facelets[0])]
+
+    @property
+    def colors(self):
+        labels = self._cube.labels
+        axes = self._axes[self._cube.state.index(self._facelets[0])]
+        return [None if sticker is None else labels[sticker] for sticker in axes]
+
     def __str__(self):
         colors = "".join(c for c in self.colors if c is not None)
         return f"({self.type}, {colors}, {self.pos})"
 
     def _set_piece_type(self):
-        if self.colors.count(None) == 2:
+        if len(self._facelets) == 1:
             self.type = FACE
-        elif self.colors.count(None) == 1:
+        elif len(self._facelets) == 2:
             self.type = EDGE
-        elif self.colors.count(None) == 0:
+        elif len(self._facelets) == 3:
             self.type = CORNER
         else:
-            raise ValueError(f"Must have 1, 2 or 3 colours – given colors={self.colors}")
-
-    def rotate(self, matrix):
-        """Apply the given rotation matrix to this piece and adjust sticker positions."""
-        before = self.pos
-        self.pos = matrix * self.pos
-        # We need to swap colours so that stickers remain on the correct faces.
-        rot = self.pos - before
-        if not any(rot):
-            return  # no change occurred
-        if rot.count(0) == 2:
-            rot += matrix * rot
-        # Exactly two components of rot are non‑zero
-        i, j = (i for i, x in enumerate(rot) if x != 0)
-        self.colors[i], self.colors[j] = self.colors[j], self.colors[i]
+            raise ValueError(f"Must have 1, 2 or 3 colours – given facelets={self._facelets}")
 
 
 class Cube:
-    """Stores pieces which are addressed through an x–y–z coordinate system.
+    """Stores stickers which are addressed through an x–y–z coordinate system.
 
     * –x is the LEFT direction, +x is the RIGHT direction
     * –y is the DOWN direction, +y is the UP direction
@@ -155,20 +434,41 @@ class Cube:
     The cube is constructed from a 54‑character string where each
     character represents a sticker in the net diagram.  See
     ``Cube.__init__`` for details.
+
+    The state is a facelet permutation: ``labels`` holds the colour of
+    every sticker as given to the constructor and ``state[i]`` is the
+    sticker currently shown at net position ``i``.  Each move is a fixed
+    gather over ``state`` taken from ``PERMS``.
     """
 
     def _from_cube(self, c):
-        # Copy pieces from another cube
-        self.faces = [Piece(pos=Point(p.pos), colors=p.colors) for p in c.faces]
-        self.edges = [Piece(pos=Point(p.pos), colors=p.colors) for p in c.edges]
-        self.corners = [Piece(pos=Point(p.pos), colors=p.colors) for p in c.corners]
-        self.pieces = self.faces + self.edges + self.corners
-
-    def _assert_data(self):
-        assert len(self.pieces) == 26
-        assert all(p.type == FACE for p in self.faces)
-        assert all(p.type == EDGE for p in self.edges)
-        assert all(p.type == CORNER for p in self.corners)
+        # Copy the sticker state from another cube.  Both tuples are
+        # immutable, so sharing them is enough; piece views are only built
+        # if the copy is asked for them.
+        self.labels = c.labels
+        self.state = c.state
+        self._packed_state = c._packed_state
+        self._packed_colors = c._packed_colors
+        self._piece_by_colors = c._piece_by_colors
+        self._pieces = None
+
+    @property
+    def pieces(self):
+        if self._pieces is None:
+            self._pieces = [Piece(self, i) for i in range(len(_PIECE_FACELETS))]
+        return self._pieces
+
+    @property
+    def faces(self):
+        return self.pieces[0:6]
+
+    @property
+    def edges(self):
+        return self.pieces[6:18]
+
+    @property
+    def corners(self):
+        return self.pieces[18:26]
 
     def __init__(self, cube_str):
         """Construct a cube from a 54‑character string or copy another cube.
@@ -185,9 +485,9 @@ class Cube:
             DDD
             DDD
 
-        Indices (0–53) are indicated in comments in the original
-        implementation.  The back face is mirrored horizontally
-        during unfolding.  Each sticker must be a single character.
+        Indices (0–53) run left to right, top to bottom through the
+        diagram.  The back face is mirrored horizontally during
+        unfolding.  Each sticker must be a single character.
         """
         if isinstance(cube_str, Cube):
             self._from_cube(cube_str)
@@ -197,181 +497,172 @@ class Cube:
         cube_str = "".join(x for x in cube_str if x not in string.whitespace)
         assert len(cube_str) == 54
 
-        # faces
-        self.faces = (
-            Piece(pos=RIGHT, colors=(cube_str[28], None, None)),
-            Piece(pos=LEFT,  colors=(cube_str[22], None, None)),
-            Piece(pos=UP,    colors=(None, cube_str[4],  None)),
-            Piece(pos=DOWN,  colors=(None, cube_str[49], None)),
-            Piece(pos=FRONT, colors=(None, None, cube_str[25])),
-            Piece(pos=BACK,  colors=(None, None, cube_str[31]))
-        )
-        # edges
-        self.edges = (
-            Piece(pos=RIGHT + UP,    colors=(cube_str[16], cube_str[5], None)),
-            Piece(pos=RIGHT + DOWN,  colors=(cube_str[40], cube_str[50], None)),
-            Piece(pos=RIGHT + FRONT, colors=(cube_str[27], None, cube_str[26])),
-            Piece(pos=RIGHT + BACK,  colors=(cube_str[29], None, cube_str[30])),
-            Piece(pos=LEFT + UP,     colors=(cube_str[10], cube_str[3], None)),
-            Piece(pos=LEFT + DOWN,   colors=(cube_str[34], cube_str[48], None)),
-            Piece(pos=LEFT + FRONT,  colors=(cube_str[23], None, cube_str[24])),
-            Piece(pos=LEFT + BACK,   colors=(cube_str[21], None, cube_str[32])),
-            Piece(pos=UP + FRONT,    colors=(None, cube_str[7],  cube_str[13])),
-            Piece(pos=UP + BACK,     colors=(None, cube_str[1],  cube_str[19])),
-            Piece(pos=DOWN + FRONT,  colors=(None, cube_str[46], cube_str[37])),
-            Piece(pos=DOWN + BACK,   colors=(None, cube_str[52], cube_str[43]))
-        )
-        # corners
-        self.corners = (
-            Piece(pos=RIGHT + UP + FRONT,   colors=(cube_str[15], cube_str[8], cube_str[14])),
-            Piece(pos=RIGHT + UP + BACK,    colors=(cube_str[17], cube_str[2], cube_str[18])),
-            Piece(pos=RIGHT + DOWN + FRONT, colors=(cube_str[39], cube_str[47], cube_str[38])),
-            Piece(pos=RIGHT + DOWN + BACK,  colors=(cube_str[41], cube_str[53], cube_str[42])),
-            Piece(pos=LEFT + UP + FRONT,    colors=(cube_str[11], cube_str[6], cube_str[12])),
-            Piece(pos=LEFT + UP + BACK,     colors=(cube_str[9],  cube_str[0], cube_str[20])),
-            Piece(pos=LEFT + DOWN + FRONT,  colors=(cube_str[35], cube_str[45], cube_str[36])),
-            Piece(pos=LEFT + DOWN + BACK,   colors=(cube_str[33], cube_str[51], cube_str[44]))
-        )
-        self.pieces = self.faces + self.edges + self.corners
-        self._assert_data()
+        self.labels = tuple(cube_str)
+        self.state = tuple(range(54))
+        # Moves never change which colours a piece carries, so this lookup
+        # from colour set to piece index stays valid for the cube's lifetime
+        self._piece_by_colors = {}
+        for i, facelets in enumerate(_PIECE_FACELETS):
+            self._piece_by_colors.setdefault(frozenset(cube_str[f] for f in facelets), i)
+        self._packed_state = None
+        self._packed_colors = None
+        self._pieces = None
 
     def is_solved(self):
         """Return True if the cube is in the solved state."""
-        def check(colors):
-            assert len(colors) == 9
-            return all(c == colors[0] for c in colors)
-        return (check([piece.colors[2] for piece in self._face(FRONT)]) and
-                check([piece.colors[2] for piece in self._face(BACK)]) and
-                check([piece.colors[1] for piece in self._face(UP)]) and
-                check([piece.colors[1] for piece in self._face(DOWN)]) and
-                check([piece.colors[0] for piece in self._face(LEFT)]) and
-                check([piece.colors[0] for piece in self._face(RIGHT)]))
-
-    def _face(self, axis):
-        """Return a list of pieces on the given face.
-
-        Parameters
-        ----------
-        axis : Point
-            One of ``LEFT``, ``RIGHT``, ``UP``, ``DOWN``, ``FRONT`` or ``BACK``.
-        """
-        assert axis.count(0) == 2
-        return [p for p in self.pieces if p.pos.dot(axis) > 0]
-
-    def _slice(self, plane):
-        """Return a list of pieces in the given slice.
-
-        The plane must be the sum of two axis constants (e.g. ``X_AXIS + Y_AXIS``).
-        """
-        assert plane.count(0) == 1
-        i = next(i for i, x in enumerate(plane) if x == 0)
-        return [p for p in self.pieces if p.pos[i] == 0]
-
-    def _rotate_face(self, face, matrix):
-        self._rotate_pieces(self._face(face), matrix)
-
-    def _rotate_slice(self, plane, matrix):
-        self._rotate_pieces(self._slice(plane), matrix)
-
-    def _rotate_pieces(self, pieces, matrix):
-        for piece in pieces:
-            piece.rotate(matrix)
+        colors = operator.itemgetter(*self.state)(self.labels)
+        return _FACE_CENTRES(colors) == colors
 
     # Standard Rubik's Cube Notation: http://ruwix.com/the-rubiks-cube/notation/
-    def L(self):  self._rotate_face(LEFT, ROT_YZ_CC)
-    def Li(self): self._rotate_face(LEFT, ROT_YZ_CW)
-    def R(self):  self._rotate_face(RIGHT, ROT_YZ_CW)
-    def Ri(self): self._rotate_face(RIGHT, ROT_YZ_CC)
-    def U(self):  self._rotate_face(UP, ROT_XZ_CW)
-    def Ui(self): self._rotate_face(UP, ROT_XZ_CC)
-    def D(self):  self._rotate_face(DOWN, ROT_XZ_CC)
-    def Di(self): self._rotate_face(DOWN, ROT_XZ_CW)
-    def F(self):  self._rotate_face(FRONT, ROT_XY_CW)
-    def Fi(self): self._rotate_face(FRONT, ROT_XY_CC)
-    def B(self):  self._rotate_face(BACK, ROT_XY_CC)
-    def Bi(self): self._rotate_face(BACK, ROT_XY_CW)
-    def M(self):  self._rotate_slice(Y_AXIS + Z_AXIS, ROT_YZ_CC)
-    def Mi(self): self._rotate_slice(Y_AXIS + Z_AXIS, ROT_YZ_CW)
-    def E(self):  self._rotate_slice(X_AXIS + Z_AXIS, ROT_XZ_CC)
-    def Ei(self): self._rotate_slice(X_AXIS + Z_AXIS, ROT_XZ_CW)
-    def S(self):  self._rotate_slice(X_AXIS + Y_AXIS, ROT_XY_CW)
-    def Si(self): self._rotate_slice(X_AXIS + Y_AXIS, ROT_XY_CC)
-    def X(self):  self._rotate_pieces(self.pieces, ROT_YZ_CW)
-    def Xi(self): self._rotate_pieces(self.pieces, ROT_YZ_CC)
-    def Y(self):  self._rotate_pieces(self.pieces, ROT_XZ_CW)
-    def Yi(self): self._rotate_pieces(self.pieces, ROT_XZ_CC)
-    def Z(self):  self._rotate_pieces(self.pieces, ROT_XY_CW)
-    def Zi(self): self._rotate_pieces(self.pieces, ROT_XY_CC)
+    L  = _move_method('L')
+    Li = _move_method('Li')
+    R  = _move_method('R')
+    Ri = _move_method('Ri')
+    U  = _move_method('U')
+    Ui = _move_method('Ui')
+    D  = _move_method('D')
+    Di = _move_method('Di')
+    F  = _move_method('F')
+    Fi = _move_method('Fi')
+    B  = _move_method('B')
+    Bi = _move_method('Bi')
+    M  = _move_method('M')
+    Mi = _move_method('Mi')
+    E  = _move_method('E')
+    Ei = _move_method('Ei')
+    S  = _move_method('S')
+    Si = _move_method('Si')
+    X  = _move_method('X')
+    Xi = _move_method('Xi')
+    Y  = _move_method('Y')
+    Yi = _move_method('Yi')
+    Z  = _move_method('Z')
+    Zi = _move_method('Zi')
 
     def sequence(self, move_str):
         """Apply a sequence of moves expressed as space‑delimited notations."""
-        moves = [getattr(self, name) for name in move_str.split()]
-        for move in moves:
-            move()
+        self.state = _sequence_gather(move_str)(self.state)
+
+    def apply_tokens(self, moves):
+        """Apply a sequence of moves given as a tuple of move names."""
+        self.state = _composed_gather(moves)(self.state)
 
     def find_piece(self, *colors):
         """Return the piece that contains exactly the given colours."""
         if None in colors:
             return None
-        for p in self.pieces:
-            if p.colors.count(None) == 3 - len(colors) and all(c in p.colors for c in colors):
-                return p
-        return None
+        i = self._piece_by_colors.get(frozenset(colors))
+        if i is None or len(_PIECE_FACELETS[i]) != len(colors):
+            return None
+        return self.pieces[i]
 
     def get_piece(self, x, y, z):
         """Return the ``Piece`` at the given coordinates."""
-        point = Point(x, y, z)
-        for p in self.pieces:
-            if p.pos == point:
-                return p
+        facelet = _FACELET_AT.get((x, y, z))
+        if facelet is None:
+            return None
+        return self.pieces[_PIECE_OF_FACELET[self.state[facelet]]]
+
+    def color_at(self, pos, axis):
+        """Return the colour of the sticker at ``pos`` facing along ``axis``.
+
+        Equivalent to ``self[pos].colors[axis]`` but reads the facelet
+        straight from the state without building a piece view.  Returns
+        ``None`` if the piece at ``pos`` has no sticker on that axis.
+        """
+        facelet = _FACELET_INDEX.get((pos, axis))
+        if facelet is None:
+            return None
+        return self.labels[self.state[facelet]]
+
+    def colors_at(self, stickers):
+        """Return the colours of several stickers as a tuple.
+
+        ``stickers`` is a tuple of ``(pos, axis)`` pairs as taken by
+        ``color_at``.  The colours are read with a single gather, which is
+        cached per tuple of stickers.
+        """
+        return _sticker_gather(stickers)(self._packed())
 
     def __getitem__(self, *args):
         if len(args) == 1:
             return self.get_piece(*args[0])
         return self.get_piece(*args)
 
+    def _packed(self):
+        """Return the sticker colours in net order packed into one string.
+
+        The string is rebuilt only when the state has changed since the
+        last call, so repeated comparisons and hashing of an unchanged cube
+        are a single string compare or a cached string hash.
+        """
+        if self._packed_state is not self.state:
+            self._packed_colors = "".join(operator.itemgetter(*self.state)(self.labels))
+            self._packed_state = self.state
+        return self._packed_colors
+
     def __eq__(self, other):
-        return isinstance(other, Cube) and self._color_list() == other._color_list()
+        return isinstance(other, Cube) and self._packed() == other._packed()
 
     def __ne__(self, other):
         return not (self == other)
 
+    def __hash__(self):
+        # Note that the hash follows the colours, so it changes with every move
+        return hash(self._packed())
+
+    def coord_index(self):
+        """Return the phase‑one coordinate of the cube as a single int.
+
+        Combines the corner orientation (twist), edge orientation (flip)
+        and the positions of the four middle slice edges (slice) as
+        ``twist * N_FLIP * N_SLICE + flip * N_SLICE + slice``.  Orientation
+        is measured against the current up/down and front/back centre
+        colours.  The solved cube has index 0, and so does any position
+        that only differs from it by moves in <U, D, R2, L2, F2, B2>.
+        """
+        colors = self._packed()
+        ud = (colors[4], colors[49])
+        fb = (colors[25], colors[31])
+        twist = 0
+        for facelets in reversed(_CORNER_FACELETS[:7]):
+            twist = twist * 3 + next(i for i, f in enumerate(facelets) if colors[f] in ud)
+        flip = 0
+        slice_ = 0
+        k = 0
+        for i, (first, second) in enumerate(_EDGE_FACELETS):
+            a, b = colors[first], colors[second]
+            if a in ud or b in ud:
+                flipped = a not in ud
+            else:
+                flipped = a not in fb
+                # count slice edges from the last position so solved is 0
+                k += 1
+                slice_ += math.comb(11 - i, 5 - k)
+            if i < 11 and flipped:
+                flip |= 1 << i
+        return (twist * N_FLIP + flip) * N_SLICE + slice_
+
     def colors(self):
         """Return a set containing the colours of all stickers on the cube."""
-        return set(c for piece in self.pieces for c in piece.colors if c is not None)
+        return set(self.labels)
 
     # Helper accessors for the centre colours
-    def left_color(self): return self[LEFT].colors[0]
-    def right_color(self): return self[RIGHT].colors[0]
-    def up_color(self): return self[UP].colors[1]
-    def down_color(self): return self[DOWN].colors[1]
-    def front_color(self): return self[FRONT].colors[2]
-    def back_color(self): return self[BACK].colors[2]
+    def left_color(self): return self.labels[self.state[22]]
+    def right_color(self): return self.labels[self.state[28]]
+    def up_color(self): return self.labels[self.state[4]]
+    def down_color(self): return self.labels[self.state[49]]
+    def front_color(self): return self.labels[self.state[25]]
+    def back_color(self): return self.labels[self.state[31]]
 
     def _color_list(self):
         """Return the colours in unfolded net order for rendering and comparison."""
-        right = [p.colors[0] for p in sorted(self._face(RIGHT), key=lambda p: (-p.pos.y, -p.pos.z))]
-        left  = [p.colors[0] for p in sorted(self._face(LEFT),  key=lambda p: (-p.pos.y, p.pos.z))]
-        up    = [p.colors[1] for p in sorted(self._face(UP),    key=lambda p: (p.pos.z, p.pos.x))]
-        down  = [p.colors[1] for p in sorted(self._face(DOWN),  key=lambda p: (-p.pos.z, p.pos.x))]
-        front = [p.colors[2] for p in sorted(self._face(FRONT), key=lambda p: (-p.pos.y, p.pos.x))]
-        back  = [p.colors[2] for p in sorted(self._face(BACK),  key=lambda p: (-p.pos.y, -p.pos.x))]
-        return (up + left[0:3] + front[0:3] + right[0:3] + back[0:3] +
-                left[3:6] + front[3:6] + right[3:6] + back[3:6] +
-                left[6:9] + front[6:9] + right[6:9] + back[6:9] + down)
+        # Facelets are stored in net order, so this is just the packed string
+        return list(self._packed())
 
     def flat_str(self):
         """Return a flat string representation of the cube's colours."""
-        return "".join(x for x in str(self) if x not in string.whitespace)
+        return self._packed()
 
     def __str__(self):
-        template = ("    {}{}{}\n"
-                    "    {}{}{}\n"
-                    "    {}{}{}\n"
-                    "{}{}{} {}{}{} {}{}{} {}{}{}\n"
-                    "{}{}{} {}{}{} {}{}{} {}{}{}\n"
-                    "{}{}{} {}{}{} {}{}{} {}{}{}\n"
-                    "    {}{}{}\n"
-                    "    {}{}{}\n"
-                    "    {}{}{}")
-        return "    " + template.format(*self._color_list()).strip()
\ No newline at end of file
+        return _NET_TEMPLATE.format(*self._packed())
@@ -1,25 +1,41 @@
-class Point:
-    """A 3D point/vector used by the Rubik's cube implementation."""
+import numbers
+import operator
 
-    def __init__(self, x, y=None, z=None):
+
+class Point(tuple):
+    """An immutable 3D point/vector used by the Rubik's cube implementation.
+
+    Points are tuples of ``(x, y, z)``, so they compare and hash like the
+    equivalent tuple and carry no per-instance ``__dict__``.  Arithmetic is
+    element-wise and always returns a new ``Point``, including when the
+    ``Point`` is the right-hand operand, rather than falling back to tuple
+    concatenation or repetition.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, x, y=None, z=None):
         """Construct a Point from an (x, y, z) tuple or an iterable.
 
         The constructor accepts either three scalars or any iterable with
         three values.  Each coordinate must not be ``None``.
         """
-        try:
-            # convert from an iterable
-            ii = iter(x)
-            self.x = next(ii)
-            self.y = next(ii)
-            self.z = next(ii)
-        except TypeError:
-            # not iterable
-            self.x = x
-            self.y = y
-            self.z = z
-        if any(val is None for val in self):
+        if y is None and z is None:
+            try:
+                # convert from an iterable
+                ii = iter(x)
+                x, y, z = next(ii), next(ii), next(ii)
+            except TypeError:
+                # not iterable
+                pass
+        self = tuple.__new__(cls, (x, y, z))
+        if x is None or y is None or z is None:
             raise ValueError(f"Point does not allow None values: {self}")
+        return self
+
+    x = property(operator.itemgetter(0))
+    y = property(operator.itemgetter(1))
+    z = property(operator.itemgetter(2))
 
     def __str__(self):
         return str(tuple(self))
@@ -27,62 +43,55 @@ class Point:
     def __repr__(self):
         return "Point" + str(self)
 
+    def __eq__(self, other):
+        # Lists of three values compare equal as well, as tuples do
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__ne__(self, other)
+
+    __hash__ = tuple.__hash__
+
     def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y, self.z + other.z)
+        return Point(self[0] + other[0], self[1] + other[1], self[2] + other[2])
+
+    def __radd__(self, other):
+        # Without this, ``tuple + Point`` would fall back to concatenation
+        return _as_point(other) + self
 
     def __sub__(self, other):
-        return Point(self.x - other.x, self.y - other.y, self.z - other.z)
+        return Point(self[0] - other[0], self[1] - other[1], self[2] - other[2])
+
+    def __rsub__(self, other):
+        return _as_point(other) - self
 
     def __mul__(self, other):
-        return Point(self.x * other, self.y * other, self.z * other)
+        if not isinstance(other, numbers.Number):
+            raise TypeError(f"Point can only be multiplied by a number, not {type(other).__name__}")
+        return Point(self[0] * other, self[1] * other, self[2] * other)
+
+    __rmul__ = __mul__
 
     def dot(self, other):
         """Return the dot product of this point with another point."""
-        return self.x * other.x + self.y * other.y + self.z * other.z
+        return self[0] * other[0] + self[1] * other[1] + self[2] * other[2]
 
     def cross(self, other):
         """Return the cross product of this point with another point."""
-        return Point(self.y * other.z - self.z * other.y,
-                     self.z * other.x - self.x * other.z,
-                     self.x * other.y - self.y * other.x)
-
-    def __getitem__(self, item):
-        if item == 0:
-            return self.x
-        elif item == 1:
-            return self.y
-        elif item == 2:
-            return self.z
-        raise IndexError("Point index out of range")
-
-    def __iter__(self):
-        yield self.x
-        yield self.y
-        yield self.z
-
-    def count(self, val):
-        return int(self.x == val) + int(self.y == val) + int(self.z == val)
+        return Point(self[1] * other[2] - self[2] * other[1],
+                     self[2] * other[0] - self[0] * other[2],
+                     self[0] * other[1] - self[1] * other[0])
 
-    def __iadd__(self, other):
-        self.x += other.x
-        self.y += other.y
-        self.z += other.z
-        return self
 
-    def __isub__(self, other):
-        self.x -= other.x
-        self.y -= other.y
-        self.z -= other.z
-        return self
-
-    def __eq__(self, other):
-        if isinstance(other, (tuple, list)):
-            return self.x == other[0] and self.y == other[1] and self.z == other[2]
-        return (isinstance(other, self.__class__) and self.x == other.x
-                and self.y == other.y and self.z == other.z)
-
-    def __ne__(self, other):
-        return not (self == other)
+def _as_point(other):
+    """Return ``other`` as a ``Point`` for reflected arithmetic, or raise TypeError."""
+    if not isinstance(other, (tuple, list)) or len(other) != 3:
+        raise TypeError(f"Point arithmetic needs three values, not {other!r}")
+    return Point(other)
 
 
 class Matrix:
@@ -136,13 +145,25 @@ class Matrix:
 
     def __mul__(self, other):
         """Do matrix–matrix or matrix–point multiplication."""
+        v = self.vals
         if isinstance(other, Point):
             # Multiply a matrix by a point
-            return Point(other.dot(Point(row)) for row in self.rows())
+            x, y, z = other
+            return Point(v[0] * x + v[1] * y + v[2] * z,
+                         v[3] * x + v[4] * y + v[5] * z,
+                         v[6] * x + v[7] * y + v[8] * z)
         elif isinstance(other, Matrix):
             # Multiply a matrix by another matrix
-            return Matrix(Point(row).dot(Point(col))
-                          for row in self.rows() for col in other.cols())
+            w = other.vals
+            return Matrix(v[0] * w[0] + v[1] * w[3] + v[2] * w[6],
+                          v[0] * w[1] + v[1] * w[4] + v[2] * w[7],
+                          v[0] * w[2] + v[1] * w[5] + v[2] * w[8],
+                          v[3] * w[0] + v[4] * w[3] + v[5] * w[6],
+                          v[3] * w[1] + v[4] * w[4] + v[5] * w[7],
+                          v[3] * w[2] + v[4] * w[5] + v[5] * w[8],
+                          v[6] * w[0] + v[7] * w[3] + v[8] * w[6],
+                          v[6] * w[1] + v[7] * w[4] + v[8] * w[7],
+                          v[6] * w[2] + v[7] * w[5] + v[8] * w[8])
         else:
             raise TypeError(f"Unsupported multiplication with type {type(other)}")
 
@@ -9,9 +9,10 @@ of cube moves.  It implements three optimisations:
   replaced with the inverse move (e.g. ``R R R`` → ``Ri``).
 * **Do/undo optimisation:** cancelling move pairs are removed (e.g.
   ``R Ri`` → ```` and ``R R Ri Ri`` → ````).
-* **Cube rotation optimisation:** consecutive full cube rotations that
-  start and end with inverses are collapsed by adjusting the inner
-  moves (see ``_unrotate`` for details).
+* **Cube rotation optimisation:** full cube rotations are removed by
+  rewriting the moves that follow them into the starting orientation;
+  any net rotation is appended once at the end (see
+  ``apply_no_full_cube_rotation_optimization`` for details).
 
 These optimisations are optional and do not affect correctness.  They
 are useful for reducing the total number of moves returned by the
@@ -20,6 +21,11 @@ solver.
 
 from rubik import cube
 
+# All move names, and the whole-cube rotations among them
+ROTATIONS = ('X', 'Xi', 'Y', 'Yi', 'Z', 'Zi')
+MOVES = ('L', 'Li', 'R', 'Ri', 'U', 'Ui', 'D', 'Di', 'F', 'Fi', 'B', 'Bi',
+         'M', 'Mi', 'E', 'Ei', 'S', 'Si') + ROTATIONS
+
 # Rotation tables for X, Y and Z axes
 X_ROT_CW = {
     'U': 'F',
@@ -56,20 +62,19 @@ Y_ROT_CC = {v: k for k, v in Y_ROT_CW.items()}
 Z_ROT_CC = {v: k for k, v in Z_ROT_CW.items()}
 
 
+_ROT_TABLES = {
+    'X': X_ROT_CW,
+    'Xi': X_ROT_CC,
+    'Y': Y_ROT_CW,
+    'Yi': Y_ROT_CC,
+    'Z': Z_ROT_CW,
+    'Zi': Z_ROT_CC,
+}
+
+
 def get_rot_table(rot: str):
     """Return the rotation mapping table for the given cube rotation."""
-    if rot == 'X':
-        return X_ROT_CW
-    elif rot == 'Xi':
-        return X_ROT_CC
-    elif rot == 'Y':
-        return Y_ROT_CW
-    elif rot == 'Yi':
-        return Y_ROT_CC
-    elif rot == 'Z':
-        return Z_ROT_CW
-    elif rot == 'Zi':
-        return Z_ROT_CC
+    return _ROT_TABLES.get(rot)
 
 
 def _invert(move: str) -> str:
@@ -78,64 +83,94 @@ def _invert(move: str) -> str:
 
 
 def apply_repeat_three_optimization(moves: list[str]) -> None:
-    """Collapse three identical moves in a row into a single inverse move."""
-    changed = False
-    i = 0
-    while i < len(moves) - 2:
-        if moves[i] == moves[i + 1] == moves[i + 2]:
-            moves[i:i + 3] = [_invert(moves[i])]
-            changed = True
-        else:
-            i += 1
-    if changed:
-        apply_repeat_three_optimization(moves)
+    """Collapse three identical moves in a row into a single inverse move.
 
+    Works in a single left-to-right pass over an output stack: each move is
+    pushed and any triple that forms at the top of the stack is replaced by
+    its inverse straight away, which may in turn complete another triple.
+    """
+    result: list[str] = []
+    for move in moves:
+        result.append(move)
+        while len(result) >= 3 and result[-1] == result[-2] == result[-3]:
+            inverse = _invert(result[-1])
+            del result[-3:]
+            result.append(inverse)
+    moves[:] = result
 
-def apply_do_undo_optimization(moves: list[str]) -> None:
-    """Remove cancelling move pairs from the sequence."""
-    changed = False
-    i = 0
-    while i < len(moves) - 1:
-        if _invert(moves[i]) == moves[i + 1]:
-            moves[i:i + 2] = []
-            changed = True
-        else:
-            i += 1
-    if changed:
-        apply_do_undo_optimization(moves)
 
+def apply_do_undo_optimization(moves: list[str]) -> None:
+    """Remove cancelling move pairs from the sequence.
 
-def _unrotate(rot: str, moves: list[str]) -> list[str]:
-    """Internal helper to remove a pair of cube rotations around a block of moves."""
-    rot_table = get_rot_table(rot)
+    Uses the same stack approach as ``apply_repeat_three_optimization``: a
+    move that undoes the top of the stack pops it instead of being pushed.
+    """
     result: list[str] = []
     for move in moves:
-        if move in rot_table:
-            result.append(rot_table[move])
-        elif _invert(move) in rot_table:
-            result.append(_invert(rot_table[_invert(move)]))
+        if result and _invert(result[-1]) == move:
+            result.pop()
         else:
             result.append(move)
-    return result
+    moves[:] = result
+
+
+def _rotate_move(rot: str, move: str) -> str:
+    """Return ``move`` as seen after the cube rotation ``rot``."""
+    rot_table = get_rot_table(rot)
+    if move in rot_table:
+        return rot_table[move]
+    elif _invert(move) in rot_table:
+        return _invert(rot_table[_invert(move)])
+    return move
+
+
+def _build_orientations():
+    """Enumerate the 24 cube orientations reachable through X, Y and Z.
+
+    Each orientation is stored as the table rewriting a move made in that
+    orientation into the equivalent move in the starting orientation.
+    Returns the tables, the composition table ``compose[orient][rot]`` and
+    a shortest rotation sequence reaching each orientation.
+    """
+    identity = {move: move for move in MOVES}
+    tables = [identity]
+    rotations = [()]
+    ids = {tuple(identity.values()): 0}
+    compose = []
+    for orient, table in enumerate(tables):
+        row = {}
+        for rot in ROTATIONS:
+            rotated = {move: table[_rotate_move(rot, move)] for move in MOVES}
+            key = tuple(rotated.values())
+            if key not in ids:
+                ids[key] = len(tables)
+                tables.append(rotated)
+                rotations.append(rotations[orient] + (rot,))
+            row[rot] = ids[key]
+        compose.append(row)
+    assert len(tables) == 24
+    return tables, compose, rotations
+
+
+ORIENT_TABLE, ORIENT_COMPOSE, ORIENT_ROTATIONS = _build_orientations()
 
 
 def apply_no_full_cube_rotation_optimization(moves: list[str]) -> None:
-    """Remove consecutive full cube rotations that cancel out by rewriting inner moves."""
-    rots = {'X', 'Y', 'Z', 'Xi', 'Yi', 'Zi'}
-    changed = False
-    i = 0
-    while i < len(moves):
-        if moves[i] not in rots:
-            i += 1
-            continue
-        for j in reversed(range(i + 1, len(moves))):
-            if moves[j] == _invert(moves[i]):
-                moves[i:j + 1] = _unrotate(moves[i], moves[i + 1:j])
-                changed = True
-                break
-        i += 1
-    if changed:
-        apply_no_full_cube_rotation_optimization(moves)
+    """Remove full cube rotations by rewriting the moves that follow them.
+
+    The pass tracks the orientation reached by the rotations seen so far and
+    emits every other move already translated back into the starting
+    orientation.  The net rotation, if any, is appended once at the end.
+    """
+    orient = 0
+    result: list[str] = []
+    for move in moves:
+        if move in ROTATIONS:
+            orient = ORIENT_COMPOSE[orient][move]
+        else:
+            result.append(ORIENT_TABLE[orient].get(move, move))
+    result.extend(ORIENT_ROTATIONS[orient])
+    moves[:] = result
 
 
 def optimize_moves(moves: list[str]) -> list[str]:
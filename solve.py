@@ -20,11 +20,225 @@ solver is not optimised for speed or move count; its primary goal is
 educational clarity and reliability.
 """
 
+import itertools
+import operator
+from collections import deque
+
 from rubik import cube
 from rubik.maths import Point
 
 DEBUG = False  # enable to print intermediate cube states
 
+# Moves that change which colour sits in a centre
+CENTRE_MOVES = frozenset(("M", "Mi", "E", "Ei", "S", "Si", "X", "Xi", "Y", "Yi", "Z", "Zi"))
+
+
+def _alg(move_str):
+    """Split an algorithm written in move notation into a tuple of move names."""
+    return tuple(move_str.split())
+
+
+# Algorithms used by the solver, split into move names once at import
+TURN_B = _alg("B")
+TURN_F = _alg("F")
+TURN_FI = _alg("Fi")
+ROT_Z = _alg("Z")
+ROT_ZI = _alg("Zi")
+ROT_BACK_TO_FRONT = _alg("X X")
+ROT_FRONT_TO_BACK = _alg("Xi Xi")
+
+ALG_CROSS_LEFT = _alg("L L")
+ALG_CROSS_LEFT_FLIP = _alg("E L Ei Li")
+ALG_CROSS_RIGHT = _alg("R R")
+ALG_CROSS_RIGHT_FLIP = _alg("Ei R E Ri")
+
+ALG_FRD_CORNER_X = _alg("B D Bi Di")
+ALG_FRD_CORNER_Y = _alg("Bi Ri B R")
+ALG_FRD_CORNER_Z = _alg("Ri B B R Bi Bi D Bi Di")
+
+ALG_LD_EDGE_FROM_DOWN = _alg("B L Bi Li Bi Di B D")
+ALG_LD_EDGE_FROM_LEFT = _alg("Bi Di B D B L Bi Li")
+
+ALG_LL_EDGE_FLIP_ADJACENT = _alg("D F R Fi Ri Di")
+ALG_LL_EDGE_FLIP_OPPOSITE = _alg("D R F Ri Fi Di")
+
+# Moves that swap two corners on the UP face
+ALG_LL_CORNER_SWAP_12 = _alg("Li Fi L D F Di Li F L F F")  # swaps positions 1 and 2
+ALG_LL_CORNER_SWAP_13 = _alg("F Li Fi L D F Di Li F L F")  # swaps positions 1 and 3
+
+ALG_LL_EDGE_CYCLE = _alg("R R F D Ui R R Di U F R R")
+ALG_H_PATTERN = _alg("Ri S Ri Ri S S Ri Fi Fi R Si Si Ri Ri Si R Fi Fi")
+ALG_FISH = _alg("Di Li") + ALG_H_PATTERN + _alg("L D")
+
+
+def _build_z_orbits():
+    """Map every position to where 0, 1, 2 and 3 ``Z`` rotations carry it."""
+    orbits = {}
+    for pos in ((x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)):
+        orbit = [Point(pos)]
+        for _ in range(3):
+            orbit.append(cube.ROT_XY_CW * orbit[-1])
+        orbits[pos] = tuple(orbit)
+    return orbits
+
+
+_Z_ORBITS = _build_z_orbits()
+
+
+def _z_turns(pos, target) -> int:
+    """Return how many ``Z`` rotations carry ``pos`` onto ``target``."""
+    return _Z_ORBITS[tuple(pos)].index(target)
+
+
+# Stickers read by the last layer pattern checks, as (position, axis).
+# A fingerprint holds one flag per sticker, set when it shows the front
+# colour; the pattern masks below use bit i for flag i.
+LL_EDGE_STICKERS = tuple((pos, 2) for pos in ((0, 1, 1), (-1, 0, 1), (0, -1, 1), (1, 0, 1)))
+LL_CORNER_STICKERS = tuple((pos, axis)
+                           for pos in ((1, 1, 1), (1, -1, 1), (-1, -1, 1), (-1, 1, 1))
+                           for axis in range(3))
+
+# Both stickers of each last layer edge, for keys that need the side colour
+LL_EDGE_STICKERS_FULL = LL_EDGE_STICKERS + tuple(
+    (pos, 1 if pos[0] == 0 else 0) for pos, _ in LL_EDGE_STICKERS)
+
+# Home slots of the last layer corners, in the order the position phase
+# names them (c1 to c4), and the rank of each arrangement of them
+LL_CORNER_HOMES = ((1, -1, 1), (-1, -1, 1), (1, 1, 1), (-1, 1, 1))
+_LL_CORNER_SLOT = {pos: i for i, pos in enumerate(LL_CORNER_HOMES)}
+_LL_CORNER_PERM_RANK = {perm: rank for rank, perm in enumerate(itertools.permutations(range(4)))}
+
+LL_CORNER_MOVE_1 = _alg("Ri Fi R Fi Ri F F R F F")
+LL_CORNER_MOVE_2 = _alg("R F Ri F R F F Ri F F")
+
+
+def _mask(stickers, *selected):
+    """Return the fingerprint bits for the given stickers."""
+    return sum(1 << stickers.index(s) for s in selected)
+
+
+def _pattern_table(stickers, solved, patterns, default):
+    """Map every fingerprint over ``stickers`` to the algorithm to apply.
+
+    ``patterns`` is an ordered list of ``(mask, value, move)``; the first
+    pattern with ``fingerprint & mask == value`` wins, otherwise
+    ``default`` is used.  Fingerprints matching ``solved`` (also a
+    ``(mask, value)`` pair) are left out, so a missing key means done.
+    """
+    table = {}
+    for fp in range(1 << len(stickers)):
+        if fp & solved[0] == solved[1]:
+            continue
+        flags = tuple(bool(fp >> i & 1) for i in range(len(stickers)))
+        table[flags] = next((move for mask, value, move in patterns if fp & mask == value), default)
+    return table
+
+
+def _all_of(stickers, *selected):
+    """Return a ``(mask, value)`` pair requiring every selected sticker to be set."""
+    mask = _mask(stickers, *selected)
+    return mask, mask
+
+
+_UP, _LEFT, _DOWN, _RIGHT = LL_EDGE_STICKERS
+BACK_FACE_EDGES_TABLE = _pattern_table(
+    LL_EDGE_STICKERS,
+    solved=_all_of(LL_EDGE_STICKERS, *LL_EDGE_STICKERS),
+    patterns=(
+        (_mask(LL_EDGE_STICKERS, *LL_EDGE_STICKERS), 0, ALG_LL_EDGE_FLIP_ADJACENT),
+        (*_all_of(LL_EDGE_STICKERS, _UP, _LEFT), ALG_LL_EDGE_FLIP_ADJACENT),
+        (*_all_of(LL_EDGE_STICKERS, _LEFT, _RIGHT), ALG_LL_EDGE_FLIP_OPPOSITE),
+    ),
+    default=TURN_F,
+)
+
+
+_URF, _DRF, _DLF, _ULF = ((1, 1, 1), (1, -1, 1), (-1, -1, 1), (-1, 1, 1))
+LL_CORNER_ORIENTATION_TABLE = _pattern_table(
+    LL_CORNER_STICKERS,
+    solved=_all_of(LL_CORNER_STICKERS, (_URF, 2), (_DRF, 2), (_DLF, 2), (_ULF, 2)),
+    patterns=(
+        (*_all_of(LL_CORNER_STICKERS, (_URF, 1), (_DLF, 1), (_DRF, 0)),
+         LL_CORNER_MOVE_1),
+        (*_all_of(LL_CORNER_STICKERS, (_ULF, 1), (_URF, 0), (_DRF, 1)),
+         LL_CORNER_MOVE_2),
+        (*_all_of(LL_CORNER_STICKERS, (_DLF, 1), (_DRF, 1), (_ULF, 2), (_URF, 2)),
+         LL_CORNER_MOVE_2 + TURN_F * 2 + LL_CORNER_MOVE_1),
+        (*_all_of(LL_CORNER_STICKERS, (_ULF, 1), (_DLF, 1), (_URF, 2), (_DRF, 2)),
+         LL_CORNER_MOVE_2 + LL_CORNER_MOVE_1),
+        (*_all_of(LL_CORNER_STICKERS, (_ULF, 1), (_DRF, 0)),
+         LL_CORNER_MOVE_1 + TURN_F + LL_CORNER_MOVE_2),
+        (*_all_of(LL_CORNER_STICKERS, (_URF, 1), (_DRF, 1), (_DLF, 0), (_ULF, 0)),
+         LL_CORNER_MOVE_1 + TURN_FI + LL_CORNER_MOVE_1),
+        (*_all_of(LL_CORNER_STICKERS, (_URF, 0), (_DRF, 0), (_DLF, 0), (_ULF, 0)),
+         LL_CORNER_MOVE_1 + TURN_F * 2 + LL_CORNER_MOVE_1),
+    ),
+    default=TURN_F,
+)
+
+
+# Clockwise and counter-clockwise turns of each face as move tuples, keyed
+# on the face's direction vector
+ROT_FROM_FACE = {
+    tuple(face): tuple((name,) for name in cube.get_rot_from_face(face))
+    for face in (cube.RIGHT, cube.LEFT, cube.UP, cube.DOWN, cube.FRONT, cube.BACK)
+}
+
+# Middle layer edge slots whose face turn is taken clockwise by the cross helper
+_CROSS_CW_SLOTS = ((-1, 1, 0), (1, -1, 0))
+
+
+def _cross_edge_helper(side, move_1, move_2):
+    """Return a ``Solver`` method placing a cross edge on the left or right face.
+
+    ``side`` is -1 for the left face and 1 for the right.  The target
+    position, the centre colour to read and both orienting algorithms are
+    bound into the closure, so each call only takes the edge to place.
+    """
+    face_color_of = operator.attrgetter("left_color" if side < 0 else "right_color")
+    def place(self, edge_piece) -> None:
+        # If the edge is already correctly positioned and oriented, do nothing
+        if edge_piece.pos == (side, 0, 1) and edge_piece.colors[2] == self.front_color:
+            return
+        move = self.move
+        # Bring the piece to z = -1 layer if necessary
+        undo_move = None
+        x, y, z = edge_piece.pos
+        if z == 0:
+            cw, cc = ROT_FROM_FACE[(0, y, 0)]  # pick the UP or DOWN face
+            if (x, y, z) in _CROSS_CW_SLOTS:
+                move(cw)
+                undo_move = cc
+            else:
+                move(cc)
+                undo_move = cw
+        elif z == 1:
+            cw, cc = ROT_FROM_FACE[(x, y, 0)]
+            move(cc + cc)
+            # don't set the undo move if the piece starts out in the right position
+            # (with wrong orientation) or we'll screw up the remainder of the algorithm
+            if x != side:
+                undo_move = cw + cw
+        # Ensure z == -1
+        assert edge_piece.pos[2] == -1
+        # Rotate around the back until the piece is on the correct face
+        count = 0
+        while edge_piece.pos[:2] != (side, 0):
+            move(TURN_B)
+            count += 1
+            if count >= self.inifinite_loop_max_iterations:
+                raise Exception("Stuck in loop - unsolvable cube?\n" + str(self.cube))
+        # If we moved a correctly‑placed piece, restore it
+        if undo_move:
+            move(undo_move)
+        # Orient the edge
+        if edge_piece.colors[0] == face_color_of(self):
+            move(move_1)
+        else:
+            move(move_2)
+    place.__doc__ = f"Place a cross edge on the {'left' if side < 0 else 'right'} face."
+    return place
+
 
 class Solver:
     """A solver that uses a fixed sequence of algorithms to solve a cube."""
@@ -33,11 +247,12 @@ class Solver:
         self.cube = c
         self.colors = c.colors()
         self.moves: list[str] = []
+        self._cache_centre_colors()
         # Cache references to centre pieces for quick lookup
-        self.left_piece  = self.cube.find_piece(self.cube.left_color())
-        self.right_piece = self.cube.find_piece(self.cube.right_color())
-        self.up_piece    = self.cube.find_piece(self.cube.up_color())
-        self.down_piece  = self.cube.find_piece(self.cube.down_color())
+        self.left_piece  = self.cube.find_piece(self.left_color)
+        self.right_piece = self.cube.find_piece(self.right_color)
+        self.up_piece    = self.cube.find_piece(self.up_color)
+        self.down_piece  = self.cube.find_piece(self.down_color)
         # Protect against infinite loops in algorithms
         self.inifinite_loop_max_iterations = 12
 
@@ -67,169 +282,198 @@ class Solver:
         if DEBUG:
             print('Solved\n', self.cube)
 
-    def move(self, move_str: str) -> None:
-        """Record and apply a sequence of moves to the cube."""
-        self.moves.extend(move_str.split())
-        self.cube.sequence(move_str)
+    def _cache_centre_colors(self) -> None:
+        """Store the current centre colours as plain attributes.
+
+        The pattern checks compare against these many times per loop, so
+        reading an attribute beats calling into the cube each time.  Only
+        slice moves and whole cube rotations move the centres, so
+        ``move`` refreshes the cache after those alone.
+        """
+        c = self.cube
+        self.front_color = c.front_color()
+        self.back_color = c.back_color()
+        self.up_color = c.up_color()
+        self.down_color = c.down_color()
+        self.left_color = c.left_color()
+        self.right_color = c.right_color()
+
+    def move(self, moves: tuple[str, ...]) -> None:
+        """Record and apply a tuple of move names to the cube."""
+        self.moves += moves
+        self.cube.apply_tokens(moves)
+        if not CENTRE_MOVES.isdisjoint(moves):
+            self._cache_centre_colors()
+
+    def _fingerprint(self, stickers) -> tuple:
+        """Return a flag per sticker telling whether it shows the front colour."""
+        return tuple(map(self.front_color.__eq__, self.cube.colors_at(stickers)))
+
+    def _edge_orientation_key(self) -> tuple:
+        return self._fingerprint(LL_EDGE_STICKERS)
+
+    def _corner_orientation_key(self) -> tuple:
+        return self._fingerprint(LL_CORNER_STICKERS)
+
+    def _corner_position_key(self) -> int:
+        """Return the arrangement of the last layer corners as a rank in ``range(24)``."""
+        find, front = self.cube.find_piece, self.front_color
+        return _LL_CORNER_PERM_RANK[tuple(
+            _LL_CORNER_SLOT[tuple(find(front, side, end).pos)]
+            for side, end in ((self.right_color, self.down_color),
+                              (self.left_color, self.down_color),
+                              (self.right_color, self.up_color),
+                              (self.left_color, self.up_color)))]
+
+    def _edge_position_key(self) -> tuple:
+        """Return the last layer edge stickers as indices into the centre colours."""
+        centres = (self.front_color, self.back_color, self.up_color,
+                   self.down_color, self.left_color, self.right_color)
+        return tuple(map(centres.index, self.cube.colors_at(LL_EDGE_STICKERS_FULL)))
+
+    def _solve_phase(self, solutions, key, search) -> None:
+        """Apply the stored solution for ``key``, or run ``search`` if there is none.
+
+        A search that succeeds stores the moves it made under ``key``, so a
+        state missed when the table was built is only searched once.
+        """
+        moves = solutions.get(key)
+        if moves is None:
+            start = len(self.moves)
+            search()
+            solutions[key] = tuple(self.moves[start:])
+        elif moves:
+            self.move(moves)
 
     # --- Cross ---
     def cross(self) -> None:
         """Solve the cross on the front face."""
         if DEBUG:
             print("cross")
-        fl_piece = self.cube.find_piece(self.cube.front_color(), self.cube.left_color())
-        fr_piece = self.cube.find_piece(self.cube.front_color(), self.cube.right_color())
-        fu_piece = self.cube.find_piece(self.cube.front_color(), self.cube.up_color())
-        fd_piece = self.cube.find_piece(self.cube.front_color(), self.cube.down_color())
+        fl_piece = self.cube.find_piece(self.front_color, self.left_color)
+        fr_piece = self.cube.find_piece(self.front_color, self.right_color)
+        fu_piece = self.cube.find_piece(self.front_color, self.up_color)
+        fd_piece = self.cube.find_piece(self.front_color, self.down_color)
         # Solve left and right edges
-        self._cross_left_or_right(fl_piece, self.left_piece, self.cube.left_color(), "L L", "E L Ei Li")
-        self._cross_left_or_right(fr_piece, self.right_piece, self.cube.right_color(), "R R", "Ei R E Ri")
+        self._cross_left(fl_piece)
+        self._cross_right(fr_piece)
         # Rotate to solve up/down edges
-        self.move("Z")
-        self._cross_left_or_right(fd_piece, self.down_piece, self.cube.left_color(), "L L", "E L Ei Li")
-        self._cross_left_or_right(fu_piece, self.up_piece, self.cube.right_color(), "R R", "Ei R E Ri")
-        self.move("Zi")
+        self.move(ROT_Z)
+        self._cross_left(fd_piece)
+        self._cross_right(fu_piece)
+        self.move(ROT_ZI)
 
-    def _cross_left_or_right(self, edge_piece, face_piece, face_color, move_1, move_2) -> None:
-        """Helper to place one of the cross edges on the left or right faces."""
-        # If the edge is already correctly positioned and oriented, do nothing
-        if (edge_piece.pos == (face_piece.pos.x, face_piece.pos.y, 1)
-                and edge_piece.colors[2] == self.cube.front_color()):
-            return
-        # Bring the piece to z = -1 layer if necessary
-        undo_move = None
-        if edge_piece.pos.z == 0:
-            pos = Point(edge_piece.pos)
-            pos.x = 0  # pick the UP or DOWN face
-            cw, cc = cube.get_rot_from_face(pos)
-            if edge_piece.pos in (cube.LEFT + cube.UP, cube.RIGHT + cube.DOWN):
-                self.move(cw)
-                undo_move = cc
-            else:
-                self.move(cc)
-                undo_move = cw
-        elif edge_piece.pos.z == 1:
-            pos = Point(edge_piece.pos)
-            pos.z = 0
-            cw, cc = cube.get_rot_from_face(pos)
-            self.move(f"{cc} {cc}")
-            # don't set the undo move if the piece starts out in the right position
-            # (with wrong orientation) or we'll screw up the remainder of the algorithm
-            if edge_piece.pos.x != face_piece.pos.x:
-                undo_move = f"{cw} {cw}"
-        # Ensure z == -1
-        assert edge_piece.pos.z == -1
-        # Rotate around the back until the piece is on the correct face
-        count = 0
-        while (edge_piece.pos.x, edge_piece.pos.y) != (face_piece.pos.x, face_piece.pos.y):
-            self.move("B")
-            count += 1
-            if count >= self.inifinite_loop_max_iterations:
-                raise Exception("Stuck in loop - unsolvable cube?\n" + str(self.cube))
-        # If we moved a correctly‑placed piece, restore it
-        if undo_move:
-            self.move(undo_move)
-        # Orient the edge
-        if edge_piece.colors[0] == face_color:
-            self.move(move_1)
-        else:
-            self.move(move_2)
+    def _cross_edge_key(self, edge_piece) -> tuple:
+        """Return the edge's position and the axis its front colour faces along."""
+        return tuple(edge_piece.pos), edge_piece.colors.index(self.front_color)
+
+    def _cross_left(self, edge_piece) -> None:
+        """Place a cross edge on the left face."""
+        self._solve_phase(CROSS_LEFT_SOLUTIONS, self._cross_edge_key(edge_piece),
+                          lambda: self._cross_left_search(edge_piece))
+
+    def _cross_right(self, edge_piece) -> None:
+        """Place a cross edge on the right face."""
+        self._solve_phase(CROSS_RIGHT_SOLUTIONS, self._cross_edge_key(edge_piece),
+                          lambda: self._cross_right_search(edge_piece))
+
+    _cross_left_search = _cross_edge_helper(-1, ALG_CROSS_LEFT, ALG_CROSS_LEFT_FLIP)
+    _cross_right_search = _cross_edge_helper(1, ALG_CROSS_RIGHT, ALG_CROSS_RIGHT_FLIP)
 
     # --- Cross corners ---
     def cross_corners(self) -> None:
         """Place the four first‑layer corners."""
         if DEBUG:
             print("cross_corners")
-        fld_piece = self.cube.find_piece(self.cube.front_color(), self.cube.left_color(), self.cube.down_color())
-        flu_piece = self.cube.find_piece(self.cube.front_color(), self.cube.left_color(), self.cube.up_color())
-        frd_piece = self.cube.find_piece(self.cube.front_color(), self.cube.right_color(), self.cube.down_color())
-        fru_piece = self.cube.find_piece(self.cube.front_color(), self.cube.right_color(), self.cube.up_color())
+        fld_piece = self.cube.find_piece(self.front_color, self.left_color, self.down_color)
+        flu_piece = self.cube.find_piece(self.front_color, self.left_color, self.up_color)
+        frd_piece = self.cube.find_piece(self.front_color, self.right_color, self.down_color)
+        fru_piece = self.cube.find_piece(self.front_color, self.right_color, self.up_color)
         # Place corners in sequence, rotating the cube to reuse algorithms
-        self.place_frd_corner(frd_piece, self.right_piece, self.down_piece, self.cube.front_color())
-        self.move("Z")
-        self.place_frd_corner(fru_piece, self.up_piece, self.right_piece, self.cube.front_color())
-        self.move("Z")
-        self.place_frd_corner(flu_piece, self.left_piece, self.up_piece, self.cube.front_color())
-        self.move("Z")
-        self.place_frd_corner(fld_piece, self.down_piece, self.left_piece, self.cube.front_color())
-        self.move("Z")
+        self.place_frd_corner(frd_piece, self.right_piece, self.down_piece, self.front_color)
+        self.move(ROT_Z)
+        self.place_frd_corner(fru_piece, self.up_piece, self.right_piece, self.front_color)
+        self.move(ROT_Z)
+        self.place_frd_corner(flu_piece, self.left_piece, self.up_piece, self.front_color)
+        self.move(ROT_Z)
+        self.place_frd_corner(fld_piece, self.down_piece, self.left_piece, self.front_color)
+        self.move(ROT_Z)
 
     def place_frd_corner(self, corner_piece, right_piece, down_piece, front_color) -> None:
         """Place a single front‑right‑down corner cubie."""
+        move = self.move
         # Rotate corner to z = -1
-        if corner_piece.pos.z == 1:
-            pos = Point(corner_piece.pos)
-            pos.x = pos.z = 0
-            cw, cc = cube.get_rot_from_face(pos)
+        _, y, z = corner_piece.pos
+        if z == 1:
+            cw, cc = ROT_FROM_FACE[(0, y, 0)]
             # be careful not to screw up other pieces on the front face
             count = 0
             undo_move = cc
-            while corner_piece.pos.z != -1:
-                self.move(cw)
+            while corner_piece.pos[2] != -1:
+                move(cw)
                 count += 1
             if count > 1:
                 # go the other direction if needed
-                for _ in range(count):
-                    self.move(cc)
+                move(cc * count)
                 count = 0
-                while corner_piece.pos.z != -1:
-                    self.move(cc)
+                while corner_piece.pos[2] != -1:
+                    move(cc)
                     count += 1
                 undo_move = cw
             # insert one back rotation to move into position and then restore
-            self.move("B")
-            for _ in range(count):
-                self.move(undo_move)
-        # Rotate to be directly below its destination
-        while (corner_piece.pos.x, corner_piece.pos.y) != (right_piece.pos.x, down_piece.pos.y):
-            self.move("B")
+            move(TURN_B + undo_move * count)
+        # Rotate to be directly below its destination; back turns leave the
+        # centres alone, so the target is fixed for the whole loop
+        target = (right_piece.pos[0], down_piece.pos[1])
+        while corner_piece.pos[:2] != target:
+            move(TURN_B)
         # There are three possible orientations for a corner
-        if corner_piece.colors[0] == front_color:
-            self.move("B D Bi Di")
-        elif corner_piece.colors[1] == front_color:
-            self.move("Bi Ri B R")
+        colors = corner_piece.colors
+        if colors[0] == front_color:
+            move(ALG_FRD_CORNER_X)
+        elif colors[1] == front_color:
+            move(ALG_FRD_CORNER_Y)
         else:
-            self.move("Ri B B R Bi Bi D Bi Di")
+            move(ALG_FRD_CORNER_Z)
 
     # --- Middle layer ---
     def second_layer(self) -> None:
         """Solve the middle layer edges."""
-        rd_piece = self.cube.find_piece(self.cube.right_color(), self.cube.down_color())
-        ru_piece = self.cube.find_piece(self.cube.right_color(), self.cube.up_color())
-        ld_piece = self.cube.find_piece(self.cube.left_color(), self.cube.down_color())
-        lu_piece = self.cube.find_piece(self.cube.left_color(), self.cube.up_color())
+        rd_piece = self.cube.find_piece(self.right_color, self.down_color)
+        ru_piece = self.cube.find_piece(self.right_color, self.up_color)
+        ld_piece = self.cube.find_piece(self.left_color, self.down_color)
+        lu_piece = self.cube.find_piece(self.left_color, self.up_color)
         # Repeatedly place edges, rotating the cube between placements
-        self.place_middle_layer_ld_edge(ld_piece, self.cube.left_color(), self.cube.down_color())
-        self.move("Z")
-        self.place_middle_layer_ld_edge(rd_piece, self.cube.left_color(), self.cube.down_color())
-        self.move("Z")
-        self.place_middle_layer_ld_edge(ru_piece, self.cube.left_color(), self.cube.down_color())
-        self.move("Z")
-        self.place_middle_layer_ld_edge(lu_piece, self.cube.left_color(), self.cube.down_color())
-        self.move("Z")
+        self.place_middle_layer_ld_edge(ld_piece, self.left_color, self.down_color)
+        self.move(ROT_Z)
+        self.place_middle_layer_ld_edge(rd_piece, self.left_color, self.down_color)
+        self.move(ROT_Z)
+        self.place_middle_layer_ld_edge(ru_piece, self.left_color, self.down_color)
+        self.move(ROT_Z)
+        self.place_middle_layer_ld_edge(lu_piece, self.left_color, self.down_color)
+        self.move(ROT_Z)
 
     def place_middle_layer_ld_edge(self, ld_piece, left_color, down_color) -> None:
         """Place a single middle layer edge from the left or right faces."""
+        move = self.move
         # Move the edge into the z == -1 layer
-        if ld_piece.pos.z == 0:
-            count = 0
-            while (ld_piece.pos.x, ld_piece.pos.y) != (-1, -1):
-                self.move("Z")
-                count += 1
-            self.move("B L Bi Li Bi Di B D")
-            for _ in range(count):
-                self.move("Zi")
+        pos = ld_piece.pos
+        if pos.z == 0:
+            # turn the cube so the edge sits at left-down, insert, turn back
+            count = _z_turns(pos, (-1, -1, 0))
+            move(ROT_Z * count + ALG_LD_EDGE_FROM_DOWN + ROT_ZI * count)
         assert ld_piece.pos.z == -1
-        if ld_piece.colors[2] == left_color:
+        back = ld_piece.colors[2]
+        if back == left_color:
             # left color is on the back face, move piece to the down face
-            while ld_piece.pos.y != -1:
-                self.move("B")
-            self.move("B L Bi Li Bi Di B D")
-        elif ld_piece.colors[2] == down_color:
+            while ld_piece.pos[1] != -1:
+                move(TURN_B)
+            move(ALG_LD_EDGE_FROM_DOWN)
+        elif back == down_color:
             # down color is on the back face, move to left face
-            while ld_piece.pos.x != -1:
-                self.move("B")
-            self.move("Bi Di B D B L Bi Li")
+            while ld_piece.pos[0] != -1:
+                move(TURN_B)
+            move(ALG_LD_EDGE_FROM_LEFT)
         else:
             raise Exception("BUG!!")
 
@@ -237,184 +481,130 @@ class Solver:
     def back_face_edges(self) -> None:
         """Orient the last layer edges to form a cross on the back face."""
         # rotate BACK to FRONT
-        self.move("X X")
-        # Helper state checks for orientation patterns
-        def state1():
-            return (self.cube[0, 1, 1].colors[2] == self.cube.front_color()
-                    and self.cube[-1, 0, 1].colors[2] == self.cube.front_color()
-                    and self.cube[0, -1, 1].colors[2] == self.cube.front_color()
-                    and self.cube[1, 0, 1].colors[2] == self.cube.front_color())
-        def state2():
-            return (self.cube[0, 1, 1].colors[2] == self.cube.front_color()
-                    and self.cube[-1, 0, 1].colors[2] == self.cube.front_color())
-        def state3():
-            return (self.cube[-1, 0, 1].colors[2] == self.cube.front_color()
-                    and self.cube[1, 0, 1].colors[2] == self.cube.front_color())
-        def state4():
-            return (self.cube[0, 1, 1].colors[2] != self.cube.front_color()
-                    and self.cube[-1, 0, 1].colors[2] != self.cube.front_color()
-                    and self.cube[0, -1, 1].colors[2] != self.cube.front_color()
-                    and self.cube[1, 0, 1].colors[2] != self.cube.front_color())
+        self.move(ROT_BACK_TO_FRONT)
+        self._solve_phase(LL_EDGE_ORIENTATION_SOLUTIONS, self._edge_orientation_key(),
+                          self._back_face_edges_search)
+        self.move(ROT_FRONT_TO_BACK)
+
+    def _back_face_edges_search(self) -> None:
         # Iterate until the cross is oriented
         count = 0
-        while not state1():
-            if state4() or state2():
-                self.move("D F R Fi Ri Di")
-            elif state3():
-                self.move("D R F Ri Fi Di")
-            else:
-                self.move("F")
+        while True:
+            move = BACK_FACE_EDGES_TABLE.get(self._fingerprint(LL_EDGE_STICKERS))
+            if move is None:
+                break
+            self.move(move)
             count += 1
             if count >= self.inifinite_loop_max_iterations:
                 raise Exception("Stuck in loop - unsolvable cube\n" + str(self.cube))
-        self.move("Xi Xi")
 
     # --- Last layer corners position ---
     def last_layer_corners_position(self) -> None:
         """Permute the last layer corners into their correct positions."""
-        self.move("X X")
-        # Moves that swap two corners on the UP face
-        move_1 = "Li Fi L D F Di Li F L F F "  # swaps positions 1 and 2
-        move_2 = "F Li Fi L D F Di Li F L F "  # swaps positions 1 and 3
+        self.move(ROT_BACK_TO_FRONT)
+        self._solve_phase(LL_CORNER_POSITION_SOLUTIONS, self._corner_position_key(),
+                          self._last_layer_corners_position_search)
+        self.move(ROT_FRONT_TO_BACK)
+
+    def _last_layer_corners_position_search(self) -> None:
+        move_1 = ALG_LL_CORNER_SWAP_12
+        move_2 = ALG_LL_CORNER_SWAP_13
         # Identify corners
-        c1 = self.cube.find_piece(self.cube.front_color(), self.cube.right_color(), self.cube.down_color())
-        c2 = self.cube.find_piece(self.cube.front_color(), self.cube.left_color(), self.cube.down_color())
-        c3 = self.cube.find_piece(self.cube.front_color(), self.cube.right_color(), self.cube.up_color())
-        c4 = self.cube.find_piece(self.cube.front_color(), self.cube.left_color(), self.cube.up_color())
+        c1 = self.cube.find_piece(self.front_color, self.right_color, self.down_color)
+        c2 = self.cube.find_piece(self.front_color, self.left_color, self.down_color)
+        c3 = self.cube.find_piece(self.front_color, self.right_color, self.up_color)
+        c4 = self.cube.find_piece(self.front_color, self.left_color, self.up_color)
         # Place corner 4
-        if c4.pos == Point(1, -1, 1):
-            self.move(move_1 + "Zi " + move_1 + " Z")
-        elif c4.pos == Point(1, 1, 1):
-            self.move("Z " + move_2 + " Zi")
-        elif c4.pos == Point(-1, -1, 1):
-            self.move("Zi " + move_1 + " Z")
-        assert c4.pos == Point(-1, 1, 1)
+        if c4.pos == (1, -1, 1):
+            self.move(move_1 + ROT_ZI + move_1 + ROT_Z)
+        elif c4.pos == (1, 1, 1):
+            self.move(ROT_Z + move_2 + ROT_ZI)
+        elif c4.pos == (-1, -1, 1):
+            self.move(ROT_ZI + move_1 + ROT_Z)
+        assert c4.pos == (-1, 1, 1)
         # Place corner 2
-        if c2.pos == Point(1, 1, 1):
+        if c2.pos == (1, 1, 1):
             self.move(move_2 + move_1)
-        elif c2.pos == Point(1, -1, 1):
+        elif c2.pos == (1, -1, 1):
             self.move(move_1)
-        assert c2.pos == Point(-1, -1, 1)
+        assert c2.pos == (-1, -1, 1)
         # Place corners 1 and 3
-        if c3.pos == Point(1, -1, 1):
+        if c3.pos == (1, -1, 1):
             self.move(move_2)
-        assert c3.pos == Point(1, 1, 1)
-        assert c1.pos == Point(1, -1, 1)
-        self.move("Xi Xi")
+        assert c3.pos == (1, 1, 1)
+        assert c1.pos == (1, -1, 1)
 
     # --- Last layer corners orientation ---
     def last_layer_corners_orientation(self) -> None:
         """Orient the last layer corners correctly."""
-        self.move("X X")
-        # Define pattern detection functions for different states
-        def state1():
-            return (self.cube[1, 1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[-1, -1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[1, -1, 1].colors[0] == self.cube.front_color())
-        def state2():
-            return (self.cube[-1, 1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[1, 1, 1].colors[0] == self.cube.front_color()
-                    and self.cube[1, -1, 1].colors[1] == self.cube.front_color())
-        def state3():
-            return (self.cube[-1, -1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[1, -1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[-1, 1, 1].colors[2] == self.cube.front_color()
-                    and self.cube[1, 1, 1].colors[2] == self.cube.front_color())
-        def state4():
-            return (self.cube[-1, 1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[-1, -1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[1, 1, 1].colors[2] == self.cube.front_color()
-                    and self.cube[1, -1, 1].colors[2] == self.cube.front_color())
-        def state5():
-            return (self.cube[-1, 1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[1, -1, 1].colors[0] == self.cube.front_color())
-        def state6():
-            return (self.cube[1, 1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[1, -1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[-1, -1, 1].colors[0] == self.cube.front_color()
-                    and self.cube[-1, 1, 1].colors[0] == self.cube.front_color())
-        def state7():
-            return (self.cube[1, 1, 1].colors[0] == self.cube.front_color()
-                    and self.cube[1, -1, 1].colors[0] == self.cube.front_color()
-                    and self.cube[-1, -1, 1].colors[0] == self.cube.front_color()
-                    and self.cube[-1, 1, 1].colors[0] == self.cube.front_color())
-        def state8():
-            return (self.cube[1, 1, 1].colors[2] == self.cube.front_color()
-                    and self.cube[1, -1, 1].colors[2] == self.cube.front_color()
-                    and self.cube[-1, -1, 1].colors[2] == self.cube.front_color()
-                    and self.cube[-1, 1, 1].colors[2] == self.cube.front_color())
-        move_1 = "Ri Fi R Fi Ri F F R F F "
-        move_2 = "R F Ri F R F F Ri F F "
+        self.move(ROT_BACK_TO_FRONT)
+        self._solve_phase(LL_CORNER_ORIENTATION_SOLUTIONS, self._corner_orientation_key(),
+                          self._last_layer_corners_orientation_search)
+        # rotate corners into correct locations (cube is inverted, so swap up and down colours)
+        bru_corner = self.cube.find_piece(self.front_color, self.right_color, self.up_color)
+        while bru_corner.pos != (1, 1, 1):
+            self.move(TURN_F)
+        self.move(ROT_FRONT_TO_BACK)
+
+    def _last_layer_corners_orientation_search(self) -> None:
         count = 0
-        while not state8():
-            if state1():
-                self.move(move_1)
-            elif state2():
-                self.move(move_2)
-            elif state3():
-                self.move(move_2 + "F F " + move_1)
-            elif state4():
-                self.move(move_2 + move_1)
-            elif state5():
-                self.move(move_1 + "F " + move_2)
-            elif state6():
-                self.move(move_1 + "Fi " + move_1)
-            elif state7():
-                self.move(move_1 + "F F " + move_1)
-            else:
-                self.move("F")
+        while True:
+            move = LL_CORNER_ORIENTATION_TABLE.get(self._fingerprint(LL_CORNER_STICKERS))
+            if move is None:
+                break
+            self.move(move)
             count += 1
             if count >= self.inifinite_loop_max_iterations:
                 raise Exception("Stuck in loop - unsolvable cube:\n" + str(self.cube))
-        # rotate corners into correct locations (cube is inverted, so swap up and down colours)
-        bru_corner = self.cube.find_piece(self.cube.front_color(), self.cube.right_color(), self.cube.up_color())
-        while bru_corner.pos != Point(1, 1, 1):
-            self.move("F")
-        self.move("Xi Xi")
 
     # --- Final last layer edges ---
     def last_layer_edges(self) -> None:
         """Complete the last layer edge cycles to finish the cube."""
-        self.move("X X")
+        self.move(ROT_BACK_TO_FRONT)
+        # the search rotates back itself, except when a fish move finishes early
+        self._solve_phase(LL_EDGE_POSITION_SOLUTIONS, self._edge_position_key(),
+                          self._last_layer_edges_search)
+
+    def _last_layer_edges_search(self) -> None:
         # Identify the four edges on the last layer
-        br_edge = self.cube.find_piece(self.cube.front_color(), self.cube.right_color())
-        bl_edge = self.cube.find_piece(self.cube.front_color(), self.cube.left_color())
-        bu_edge = self.cube.find_piece(self.cube.front_color(), self.cube.up_color())
-        bd_edge = self.cube.find_piece(self.cube.front_color(), self.cube.down_color())
+        br_edge = self.cube.find_piece(self.front_color, self.right_color)
+        bl_edge = self.cube.find_piece(self.front_color, self.left_color)
+        bu_edge = self.cube.find_piece(self.front_color, self.up_color)
+        bd_edge = self.cube.find_piece(self.front_color, self.down_color)
         # Helper state checks
         def state1():
-            return (bu_edge.colors[2] != self.cube.front_color()
-                    and bd_edge.colors[2] != self.cube.front_color()
-                    and bl_edge.colors[2] != self.cube.front_color()
-                    and br_edge.colors[2] != self.cube.front_color())
+            return (bu_edge.colors[2] != self.front_color
+                    and bd_edge.colors[2] != self.front_color
+                    and bl_edge.colors[2] != self.front_color
+                    and br_edge.colors[2] != self.front_color)
         def state2():
-            return (bu_edge.colors[2] == self.cube.front_color()
-                    or bd_edge.colors[2] == self.cube.front_color()
-                    or bl_edge.colors[2] == self.cube.front_color()
-                    or br_edge.colors[2] == self.cube.front_color())
-        cycle_move = "R R F D Ui R R Di U F R R"
-        h_pattern_move = "Ri S Ri Ri S S Ri Fi Fi R Si Si Ri Ri Si R Fi Fi "
-        fish_move = "Di Li " + h_pattern_move + " L D"
+            return (bu_edge.colors[2] == self.front_color
+                    or bd_edge.colors[2] == self.front_color
+                    or bl_edge.colors[2] == self.front_color
+                    or br_edge.colors[2] == self.front_color)
+        cycle_move = ALG_LL_EDGE_CYCLE
+        h_pattern_move = ALG_H_PATTERN
+        fish_move = ALG_FISH
         if state1():
             self._handle_last_layer_state1(br_edge, bl_edge, bu_edge, bd_edge, cycle_move, h_pattern_move)
         if state2():
             self._handle_last_layer_state2(br_edge, bl_edge, bu_edge, bd_edge, cycle_move)
         # Additional patterns
         def h_pattern1():
-            return (self.cube[-1, 0, 1].colors[0] != self.cube.left_color()
-                    and self.cube[1, 0, 1].colors[0] != self.cube.right_color()
-                    and self.cube[0, -1, 1].colors[1] == self.cube.down_color()
-                    and self.cube[0, 1, 1].colors[1] == self.cube.up_color())
+            return (self.cube.color_at((-1, 0, 1), 0) != self.left_color
+                    and self.cube.color_at((1, 0, 1), 0) != self.right_color
+                    and self.cube.color_at((0, -1, 1), 1) == self.down_color
+                    and self.cube.color_at((0, 1, 1), 1) == self.up_color)
         def h_pattern2():
-            return (self.cube[-1, 0, 1].colors[0] == self.cube.left_color()
-                    and self.cube[1, 0, 1].colors[0] == self.cube.right_color()
-                    and self.cube[0, -1, 1].colors[1] == self.cube.front_color()
-                    and self.cube[0, 1, 1].colors[1] == self.cube.front_color())
+            return (self.cube.color_at((-1, 0, 1), 0) == self.left_color
+                    and self.cube.color_at((1, 0, 1), 0) == self.right_color
+                    and self.cube.color_at((0, -1, 1), 1) == self.front_color
+                    and self.cube.color_at((0, 1, 1), 1) == self.front_color)
         def fish_pattern():
-            return (self.cube[cube.FRONT + cube.DOWN].colors[2] == self.cube.down_color()
-                    and self.cube[cube.FRONT + cube.RIGHT].colors[2] == self.cube.right_color()
-                    and self.cube[cube.FRONT + cube.DOWN].colors[1] == self.cube.front_color()
-                    and self.cube[cube.FRONT + cube.RIGHT].colors[0] == self.cube.front_color())
+            return (self.cube.color_at(cube.FRONT + cube.DOWN, 2) == self.down_color
+                    and self.cube.color_at(cube.FRONT + cube.RIGHT, 2) == self.right_color
+                    and self.cube.color_at(cube.FRONT + cube.DOWN, 1) == self.front_color
+                    and self.cube.color_at(cube.FRONT + cube.RIGHT, 0) == self.front_color)
         count = 0
         while not self.cube.is_solved():
             for _ in range(4):
@@ -423,50 +613,43 @@ class Solver:
                     if self.cube.is_solved():
                         return
                 else:
-                    self.move("Z")
+                    self.move(ROT_Z)
             if h_pattern1():
                 self.move(h_pattern_move)
             elif h_pattern2():
-                self.move("Z " + h_pattern_move + "Zi")
+                self.move(ROT_Z + h_pattern_move + ROT_ZI)
             else:
                 self.move(cycle_move)
             count += 1
             if count >= self.inifinite_loop_max_iterations:
                 raise Exception("Stuck in loop - unsolvable cube:\n" + str(self.cube))
-        self.move("Xi Xi")
+        self.move(ROT_FRONT_TO_BACK)
 
     # Helpers for last layer edges state handling
-    def _handle_last_layer_state1(self, br_edge, bl_edge, bu_edge, bd_edge, cycle_move: str, h_move: str) -> None:
+    def _handle_last_layer_state1(self, br_edge, bl_edge, bu_edge, bd_edge, cycle_move: tuple, h_move: tuple) -> None:
         if DEBUG:
             print("_handle_last_layer_state1")
         def check_edge_lr():
-            return self.cube[cube.LEFT + cube.FRONT].colors[2] == self.cube.left_color()
+            return self.cube.color_at(cube.LEFT + cube.FRONT, 2) == self.left_color
         count = 0
         while not check_edge_lr():
-            self.move("F")
+            self.move(TURN_F)
             count += 1
             if count == 4:
                 raise Exception("Bug: Failed to handle last layer state1")
-        self.move(h_move)
-        for _ in range(count):
-            self.move("Fi")
+        self.move(h_move + TURN_FI * count)
 
-    def _handle_last_layer_state2(self, br_edge, bl_edge, bu_edge, bd_edge, cycle_move: str) -> None:
+    def _handle_last_layer_state2(self, br_edge, bl_edge, bu_edge, bd_edge, cycle_move: tuple) -> None:
         if DEBUG:
             print("_handle_last_layer_state2")
         def correct_edge():
-            piece = self.cube[cube.LEFT + cube.FRONT]
-            if piece.colors[2] == self.cube.front_color() and piece.colors[0] == self.cube.left_color():
-                return piece
-            piece = self.cube[cube.RIGHT + cube.FRONT]
-            if piece.colors[2] == self.cube.front_color() and piece.colors[0] == self.cube.right_color():
-                return piece
-            piece = self.cube[cube.UP + cube.FRONT]
-            if piece.colors[2] == self.cube.front_color() and piece.colors[1] == self.cube.up_color():
-                return piece
-            piece = self.cube[cube.DOWN + cube.FRONT]
-            if piece.colors[2] == self.cube.front_color() and piece.colors[1] == self.cube.down_color():
-                return piece
+            for pos, axis, color in ((cube.LEFT + cube.FRONT, 0, self.left_color),
+                                     (cube.RIGHT + cube.FRONT, 0, self.right_color),
+                                     (cube.UP + cube.FRONT, 1, self.up_color),
+                                     (cube.DOWN + cube.FRONT, 1, self.down_color)):
+                if (self.cube.color_at(pos, 2) == self.front_color
+                        and self.cube.color_at(pos, axis) == color):
+                    return self.cube[pos]
             return None
         count = 0
         while True:
@@ -477,10 +660,79 @@ class Solver:
                 break
             count += 1
             if count % 3 == 0:
-                self.move("Z")
+                self.move(ROT_Z)
             if count >= self.inifinite_loop_max_iterations:
                 raise Exception("Stuck in loop - unsolvable cube:\n" + str(self.cube))
-        while edge.pos != Point(-1, 0, 1):
-            self.move("Z")
-        assert (self.cube[cube.LEFT + cube.FRONT].colors[2] == self.cube.front_color()
-                and self.cube[cube.LEFT + cube.FRONT].colors[0] == self.cube.left_color())
\ No newline at end of file
+        count = _z_turns(edge.pos, (-1, 0, 1))
+        if count:
+            self.move(ROT_Z * count)
+        assert (self.cube.color_at(cube.LEFT + cube.FRONT, 2) == self.front_color
+                and self.cube.color_at(cube.LEFT + cube.FRONT, 0) == self.left_color)
+
+
+# A solved cube used as the starting point when building the phase tables
+_SOLVED_CUBE_STR = "OOOOOOOOOYYYWWWGGGBBBYYYWWWGGGBBBYYYWWWGGGBBBRRRRRRRRR"
+
+
+def _build_phase_solutions(key, search, generators):
+    """Return ``{key: moves}`` for every state reachable through ``generators``.
+
+    States are explored breadth first from the solved cube; each new key
+    is solved once by running ``search`` on a scratch solver, and the moves
+    it records become that key's complete solution.  ``key`` must capture
+    everything ``search`` looks at, so the stored moves are exactly the ones
+    the search would emit at solve time.  Each solution is also replayed in
+    one go, which warms the cube's gather cache and checks the replay ends
+    in the same state as the step by step search.
+    """
+    solutions = {}
+    queue = deque([cube.Cube(_SOLVED_CUBE_STR)])
+    while queue:
+        c = queue.popleft()
+        k = key(Solver(cube.Cube(c)))
+        if k in solutions:
+            continue
+        scratch = Solver(cube.Cube(c))
+        search(scratch)
+        solutions[k] = tuple(scratch.moves)
+        replay = cube.Cube(c)
+        replay.apply_tokens(solutions[k])
+        assert replay == scratch.cube
+        for moves in generators:
+            nxt = cube.Cube(c)
+            nxt.apply_tokens(moves)
+            queue.append(nxt)
+    return solutions
+
+
+def _left_edge(solver):
+    return solver.cube.find_piece(solver.front_color, solver.left_color)
+
+
+def _right_edge(solver):
+    return solver.cube.find_piece(solver.front_color, solver.right_color)
+
+
+# Every cross edge outcome depends only on where that edge sits and which way
+# it faces, so the 24 states per side are reached with plain face turns
+_FACE_TURNS = tuple((name,) for name in ("L", "R", "U", "D", "F", "B"))
+CROSS_LEFT_SOLUTIONS = _build_phase_solutions(
+    lambda s: s._cross_edge_key(_left_edge(s)),
+    lambda s: s._cross_left_search(_left_edge(s)),
+    _FACE_TURNS)
+CROSS_RIGHT_SOLUTIONS = _build_phase_solutions(
+    lambda s: s._cross_edge_key(_right_edge(s)),
+    lambda s: s._cross_right_search(_right_edge(s)),
+    _FACE_TURNS)
+LL_EDGE_ORIENTATION_SOLUTIONS = _build_phase_solutions(
+    Solver._edge_orientation_key, Solver._back_face_edges_search,
+    (TURN_F, ALG_LL_EDGE_FLIP_ADJACENT))
+LL_CORNER_POSITION_SOLUTIONS = _build_phase_solutions(
+    Solver._corner_position_key, Solver._last_layer_corners_position_search,
+    (TURN_F, ALG_LL_CORNER_SWAP_12))
+LL_CORNER_ORIENTATION_SOLUTIONS = _build_phase_solutions(
+    Solver._corner_orientation_key, Solver._last_layer_corners_orientation_search,
+    (TURN_F, LL_CORNER_MOVE_1))
+LL_EDGE_POSITION_SOLUTIONS = _build_phase_solutions(
+    Solver._edge_position_key, Solver._last_layer_edges_search,
+    (ALG_LL_EDGE_CYCLE, ROT_Z + ALG_LL_EDGE_CYCLE + ROT_ZI, ALG_H_PATTERN))
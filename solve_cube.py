@@ -15,10 +15,17 @@ python solve_cube.py
 ```
 
 The output shows the scramble moves, the solution moves and verifies
-that the cube returns to the solved state.
+that the cube returns to the solved state.  Passing a count solves that
+many random cubes instead and reports the throughput:
+
+```
+python solve_cube.py 1000
+```
 """
 
 import random
+import sys
+import time
 from rubik.cube import Cube
 from rubik.solve import Solver
 from rubik.optimize import optimize_moves
@@ -33,31 +40,81 @@ SCRAMBLE_MOVES = ["L", "R", "U", "D", "F", "B", "Li", "Ri", "Ui", "Di", "Fi", "B
 
 
 def generate_scramble(length: int = 25) -> str:
-    """Return a scramble as a space‑separated string of random moves."""
-    return " ".join(random.choice(SCRAMBLE_MOVES) for _ in range(length))
+    """Return a scramble as a space‑separated string of random moves.
 
+    Moves are drawn in batches with ``random.choices``.  A move that undoes
+    the one before it, or turns the same face a third time in a row, is
+    dropped and made up for by the next batch, so every move counts.
+    """
+    moves: list[str] = []
+    while len(moves) < length:
+        for move in random.choices(SCRAMBLE_MOVES, k=length - len(moves)):
+            if moves and move[0] == moves[-1][0] and move != moves[-1]:
+                continue
+            if len(moves) >= 2 and move == moves[-1] == moves[-2]:
+                continue
+            moves.append(move)
+    return " ".join(moves)
 
-def solve_random_cube() -> None:
-    """Scramble a cube, solve it and report the results."""
+
+def _scramble_and_solve() -> tuple[str, list[str], list[str]]:
+    """Scramble a fresh cube, solve it and verify the optimised solution.
+
+    Returns the scramble, the raw solver moves and the optimised moves.
+    """
     scramble = generate_scramble()
     cube_obj = Cube(SOLVED_CUBE_STR)
     cube_obj.sequence(scramble)
-    print("Scramble:", scramble)
     solver = Solver(cube_obj)
     solver.solve()
-    solution_moves = solver.moves
-    optimised_moves = optimize_moves(solution_moves)
+    optimised_moves = optimize_moves(solver.moves)
+    check_cube = Cube(SOLVED_CUBE_STR)
+    check_cube.sequence(scramble)
+    check_cube.apply_tokens(tuple(optimised_moves))
+    assert check_cube.is_solved(), f"Solution failed for scramble {scramble!r}"
+    return scramble, solver.moves, optimised_moves
+
+
+def solve_random_cube() -> None:
+    """Scramble a cube, solve it and report the results."""
+    scramble, solution_moves, optimised_moves = _scramble_and_solve()
+    print("Scramble:", scramble)
     print(f"Solver produced {len(solution_moves)} moves.")
     print("Solution (raw):", " ".join(solution_moves))
     print(f"Optimised to {len(optimised_moves)} moves.")
     print("Solution (optimised):", " ".join(optimised_moves))
-    # Verify solution
-    check_cube = Cube(SOLVED_CUBE_STR)
-    check_cube.sequence(scramble)
-    check_cube.sequence(" ".join(optimised_moves))
-    assert check_cube.is_solved(), "Cube should be solved after applying the solution!"
     print("Verification passed: cube is solved.")
 
 
+def solve_random_cubes(count: int) -> None:
+    """Scramble, solve and verify ``count`` cubes, then report throughput."""
+    if count < 1:
+        raise ValueError(f"count must be at least 1, got {count}")
+    total_moves = 0
+    start = time.perf_counter()
+    for _ in range(count):
+        total_moves += len(_scramble_and_solve()[2])
+    elapsed = time.perf_counter() - start
+    print(f"Solved {count} cubes in {elapsed:.2f}s ({count / elapsed:.0f} cubes/s).")
+    print(f"Average optimised solution: {total_moves / count:.1f} moves.")
+
+
+def main(argv: list[str]) -> int:
+    """Run the example; an optional argument gives the number of cubes."""
+    if len(argv) > 1:
+        try:
+            count = int(argv[1])
+        except ValueError:
+            count = 0
+        if count < 1:
+            print(f"usage: {argv[0]} [COUNT]  (COUNT must be a positive integer)",
+                  file=sys.stderr)
+            return 2
+        solve_random_cubes(count)
+    else:
+        solve_random_cube()
+    return 0
+
+
 if __name__ == "__main__":
-    solve_random_cube()
\ No newline at end of file
+    sys.exit(main(sys.argv))